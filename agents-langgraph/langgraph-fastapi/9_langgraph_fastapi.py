@@ -1,16 +1,44 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, EmailStr, Field
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
 from langgraph.graph import StateGraph, END, START
-from langchain_openai import ChatOpenAI
-from typing import Annotated, Optional, Union
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from typing import Annotated, Awaitable, Callable, Hashable, Optional, Union
 from typing_extensions import TypedDict
 from langgraph.graph.message import add_messages
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, generate_latest, multiprocess
 
+import io
 import os
+import re
+import csv
 import json
+import math
+import time
+import asyncio
 import logging
+from array import array
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager, nullcontext, suppress
+from contextvars import ContextVar
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+PROCESS_START = time.monotonic()
+
 load_dotenv()
 
 logging.basicConfig(
@@ -25,6 +53,35 @@ INFERENCE_MODEL = os.getenv("INFERENCE_MODEL")
 API_KEY = os.getenv("API_KEY")
 FASTAPI_HOST = os.getenv("FASTAPI_HOST", "0.0.0.0")
 FASTAPI_PORT = int(os.getenv("FASTAPI_PORT", "8000"))
+# Graph runs allowed at once, and how many more may wait before we answer 429
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "64"))
+MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "256"))
+CUSTOMER_MCP_SERVER_URL = os.getenv("CUSTOMER_MCP_SERVER_URL")
+FINANCE_MCP_SERVER_URL = os.getenv("FINANCE_MCP_SERVER_URL")
+# /find_orders and /find_invoices call the MCP tools directly, using the LLM graph only as a fallback
+DIRECT_LOOKUP = os.getenv("DIRECT_LOOKUP", "true").lower() in ("1", "true", "yes")
+MCP_TOOL_TIMEOUT = float(os.getenv("MCP_TOOL_TIMEOUT", "30"))
+# Direct lookups read a customer's whole order or invoice history in one call, and fail rather
+# than return a partial history past this many rows
+DIRECT_LOOKUP_MAX_ROWS = int(os.getenv("DIRECT_LOOKUP_MAX_ROWS", "10000"))
+# /question answer cache; a TTL of 0 disables it. Similar (not just identical) questions are
+# also served from the cache when an embedding model is configured
+QUESTION_CACHE_TTL_SECONDS = float(os.getenv("QUESTION_CACHE_TTL_SECONDS", "300"))
+QUESTION_CACHE_MAX_ENTRIES = int(os.getenv("QUESTION_CACHE_MAX_ENTRIES", "1000"))
+# Shared cache for multi-worker deployments, e.g. redis://redis:6379/0; unset keeps it per process
+QUESTION_CACHE_URL = os.getenv("QUESTION_CACHE_URL", "")
+QUESTION_CACHE_EMBEDDING_MODEL = os.getenv("QUESTION_CACHE_EMBEDDING_MODEL", "")
+QUESTION_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("QUESTION_CACHE_SIMILARITY_THRESHOLD", "0.95"))
+# Most recent cached questions about the same customers compared on an exact-match miss
+QUESTION_CACHE_SEMANTIC_CANDIDATES = int(os.getenv("QUESTION_CACHE_SEMANTIC_CANDIDATES", "100"))
+# Concurrent identical requests share one graph run / lookup instead of each starting their own
+COALESCE_REQUESTS = os.getenv("COALESCE_REQUESTS", "true").lower() in ("1", "true", "yes")
+# POST /find_orders/bulk: customers looked up at once, and emails accepted per request
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "16"))
+BULK_MAX_EMAILS = int(os.getenv("BULK_MAX_EMAILS", "5000"))
+# Startup warmup runs in the background; /readyz fails until it succeeds
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "5"))
 
 logger.info("Configuration loaded:")
 logger.info("  Base URL: %s", BASE_URL)
@@ -32,6 +89,100 @@ logger.info("  Model: %s", INFERENCE_MODEL)
 logger.info("  API Key: %s", "***" if API_KEY else "None")
 logger.info("  FastAPI Host: %s", FASTAPI_HOST)
 logger.info("  FastAPI Port: %s", FASTAPI_PORT)
+logger.info("  Max concurrent requests: %s", MAX_CONCURRENT_REQUESTS)
+logger.info("  Max queued requests: %s", MAX_QUEUED_REQUESTS)
+logger.info("  Customer MCP: %s", CUSTOMER_MCP_SERVER_URL)
+logger.info("  Finance MCP: %s", FINANCE_MCP_SERVER_URL)
+logger.info("  Direct lookup: %s (max rows %s)", DIRECT_LOOKUP, DIRECT_LOOKUP_MAX_ROWS)
+logger.info("  Question cache TTL: %ss, max entries: %s", QUESTION_CACHE_TTL_SECONDS, QUESTION_CACHE_MAX_ENTRIES)
+logger.info("  Question cache backend: %s", QUESTION_CACHE_URL.split("@")[-1] if QUESTION_CACHE_URL else "local")
+logger.info("  Question cache embedding model: %s (threshold %s, candidates %s)",
+            QUESTION_CACHE_EMBEDDING_MODEL or "None", QUESTION_CACHE_SIMILARITY_THRESHOLD,
+            QUESTION_CACHE_SEMANTIC_CANDIDATES)
+logger.info("  Coalesce requests: %s", COALESCE_REQUESTS)
+logger.info("  Bulk concurrency: %s, max emails: %s", BULK_CONCURRENCY, BULK_MAX_EMAILS)
+logger.info("  Warmup: %s (retry every %ss)", WARMUP_ENABLED, WARMUP_RETRY_SECONDS)
+
+
+
+def setup_tracing():
+    """OpenTelemetry tracer, exporting over OTLP when OTEL_EXPORTER_OTLP_ENDPOINT is set; None without opentelemetry"""
+    if trace is None:
+        return None
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        except ImportError:
+            logger.warning("OTEL_EXPORTER_OTLP_ENDPOINT is set but opentelemetry-sdk or the OTLP exporter is missing")
+        else:
+            provider = TracerProvider(resource=Resource.create({
+                "service.name": os.getenv("OTEL_SERVICE_NAME", "langgraph-fastapi"),
+            }))
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+            trace.set_tracer_provider(provider)
+            logger.info("  Tracing: OTLP to %s", os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"))
+    return trace.get_tracer(__name__)
+
+
+tracer = setup_tracing()
+
+
+class RequestTimings:
+    """Durations of the stages of one request: LLM, MCP calls, extraction, serialization..."""
+
+    def __init__(self):
+        # (name, milliseconds or None when unknown, description)
+        self.stages: list = []
+
+    def add(self, name: str, ms: Optional[float] = None, description: Optional[str] = None):
+        self.stages.append((name, ms, description))
+
+    def server_timing(self, total_ms: float) -> str:
+        """Server-Timing header value"""
+        parts = []
+        for name, ms, description in self.stages + [("total", total_ms, None)]:
+            part = name if ms is None else f"{name};dur={ms:.1f}"
+            if description:
+                part += f';desc="{description}"'
+            parts.append(part)
+        return ", ".join(parts)
+
+    def fields(self) -> dict:
+        """Milliseconds per stage name (summed over repeats), for structured logs and span attributes"""
+        fields = {}
+        for name, ms, _ in self.stages:
+            key = f"{name}_ms"
+            if ms is None:
+                key = f"{name}_count"
+                ms = 1
+            fields[key] = round(fields.get(key, 0) + ms, 1)
+        return fields
+
+
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def record_stage(name: str, ms: Optional[float] = None, description: Optional[str] = None):
+    """Add a stage to the current request's timings (no-op outside a request)"""
+    timings = request_timings.get()
+    if timings is not None:
+        timings.add(name, ms, description)
+
+
+@contextmanager
+def timed(name: str, description: Optional[str] = None, **attributes):
+    """Time a block as a stage of the current request, inside an OpenTelemetry span when tracing"""
+    span = tracer.start_as_current_span(name, attributes=attributes) if tracer else nullcontext()
+    start = time.perf_counter()
+    with span:
+        try:
+            yield
+        finally:
+            record_stage(name, (time.perf_counter() - start) * 1000, description)
+
 
 # Initialize LLM
 llm = ChatOpenAI(
@@ -41,23 +192,19 @@ llm = ChatOpenAI(
     use_responses_api=True
 )
 
-logger.info("Testing LLM connectivity...")
-connectivity_response = llm.invoke("Hello")
-logger.info("LLM connectivity test successful")
-
 # MCP tool binding - both customer and finance MCP servers
 llm_with_tools = llm.bind(
     tools=[
         {
             "type": "mcp",
             "server_label": "customer_mcp",
-            "server_url": os.getenv("CUSTOMER_MCP_SERVER_URL"),
+            "server_url": CUSTOMER_MCP_SERVER_URL,
             "require_approval": "never",
         },
         {
             "type": "mcp",
             "server_label": "finance_mcp",
-            "server_url": os.getenv("FINANCE_MCP_SERVER_URL"),
+            "server_url": FINANCE_MCP_SERVER_URL,
             "require_approval": "never",
         },
     ])
@@ -67,8 +214,8 @@ class State(TypedDict):
     messages: Annotated[list, add_messages]
 
 
-def chatbot(state: State):
-    message = llm_with_tools.invoke(state["messages"])
+async def chatbot(state: State):
+    message = await llm_with_tools.ainvoke(state["messages"])
     return {"messages": [message]}
 
 
@@ -79,8 +226,563 @@ graph_builder.add_edge(START, "chatbot")
 graph_builder.add_edge("chatbot", END)
 graph = graph_builder.compile()
 
+
+
+class MCPToolClient:
+    """Long-lived MCP session for calling one server's tools without the LLM."""
+
+    def __init__(self, label: str, url: str):
+        self.label = label
+        self.url = url
+        self._client: Optional[Client] = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> Client:
+        async with self._lock:
+            if self._client is None or not self._client.is_connected():
+                client = Client(self.url, timeout=MCP_TOOL_TIMEOUT)
+                await client.__aenter__()
+                self._client = client
+            return self._client
+
+    async def close(self):
+        async with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug("Error closing MCP session to %s: %s", self.url, str(e))
+
+    async def call(self, tool: str, arguments: dict) -> dict:
+        """Call a tool and return its JSON result, raising if the tool reported an error."""
+        client = await self._connect()
+        try:
+            with timed(f"mcp.{tool}", self.label, **{"mcp.server": self.label, "mcp.tool": tool}):
+                result = await client.call_tool(tool, arguments)
+        except ToolError:
+            raise
+        except Exception:
+            # Transport problem; start a new session on the next call
+            await self.close()
+            raise
+
+        data = result.structured_content
+        if data is None:
+            data = json.loads(result.content[0].text) if result.content else {}
+        if "error" in data:
+            raise RuntimeError(f"{tool} failed: {data['error']}")
+        return data
+
+
+customer_mcp = MCPToolClient("customer_mcp", CUSTOMER_MCP_SERVER_URL)
+finance_mcp = MCPToolClient("finance_mcp", FINANCE_MCP_SERVER_URL)
+
+
+# multiprocess_mode only applies when PROMETHEUS_MULTIPROC_DIR is set (gunicorn workers)
+STARTUP_SECONDS = Gauge(
+    "langgraph_api_startup_seconds", "Seconds from process start until the API accepted requests",
+    multiprocess_mode="livemax")
+WARMUP_SECONDS = Gauge(
+    "langgraph_api_warmup_seconds", "Seconds from process start until warmup succeeded",
+    multiprocess_mode="livemax")
+READY = Gauge("langgraph_api_ready", "1 once warmup has succeeded", multiprocess_mode="livemin")
+
+warmup_status = {"state": "pending", "attempts": 0, "last_error": None, "seconds": None, "mcp": {}}
+
+
+async def warmup_mcp():
+    """Open the direct-lookup MCP sessions early. Best effort: lookups fall back to the graph and
+    sessions connect on first use, so an MCP outage must not keep the pod out of rotation."""
+    for client in (customer_mcp, finance_mcp):
+        try:
+            await client._connect()
+            warmup_status["mcp"][client.label] = "connected"
+        except Exception as e:
+            warmup_status["mcp"][client.label] = f"unavailable: {e}"
+            logger.warning("Could not open MCP session to %s, direct lookups will retry: %s", client.url, str(e))
+
+
+async def warmup():
+    """Check LLM connectivity until it works, without blocking startup"""
+    if not WARMUP_ENABLED:
+        warmup_status["state"] = "disabled"
+        READY.set(1)
+        return
+
+    while True:
+        warmup_status["attempts"] += 1
+        try:
+            logger.info("Testing LLM connectivity (attempt %s)...", warmup_status["attempts"])
+            await llm.ainvoke("Hello")
+            break
+        except Exception as e:
+            warmup_status["state"] = "retrying"
+            warmup_status["last_error"] = str(e)
+            logger.warning("Warmup failed, retrying in %ss: %s", WARMUP_RETRY_SECONDS, str(e))
+            await asyncio.sleep(WARMUP_RETRY_SECONDS)
+
+    elapsed = time.monotonic() - PROCESS_START
+    warmup_status.update(state="ready", last_error=None, seconds=round(elapsed, 3))
+    WARMUP_SECONDS.set(elapsed)
+    READY.set(1)
+    logger.info("LLM connectivity test successful, ready after %.2fs", elapsed)
+    if DIRECT_LOOKUP:
+        await warmup_mcp()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup_task = asyncio.create_task(warmup())
+    STARTUP_SECONDS.set(time.monotonic() - PROCESS_START)
+    logger.info("API accepting requests after %.2fs", time.monotonic() - PROCESS_START)
+    yield
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    await customer_mcp.close()
+    await finance_mcp.close()
+
+
 # FastAPI app
-app = FastAPI(title="Customer Orders and Invoices API")
+app = FastAPI(title="Customer Orders and Invoices API", lifespan=lifespan)
+
+
+class ServerTimingMiddleware:
+    """Collect stage timings per request into a Server-Timing header, a log line and a span tree"""
+
+    QUIET_PATHS = ("/healthz", "/readyz", "/metrics")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = timings.server_timing((time.perf_counter() - start) * 1000)
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", header.encode())]}
+            await send(message)
+
+        span = tracer.start_as_current_span(
+            f"{scope['method']} {scope['path']}",
+            kind=trace.SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]},
+        ) if tracer else nullcontext()
+        with span as current_span:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                total_ms = round((time.perf_counter() - start) * 1000, 1)
+                fields = timings.fields()
+                if current_span is not None:
+                    current_span.set_attribute("http.response.status_code", status)
+                    for key, value in fields.items():
+                        current_span.set_attribute(f"timing.{key}", value)
+                if scope["path"] not in self.QUIET_PATHS:
+                    logger.info(
+                        "timing %s",
+                        " ".join(f"{key}={value}" for key, value in {
+                            "method": scope["method"], "path": scope["path"], "status": status,
+                            "total_ms": total_ms, **fields,
+                        }.items()),
+                        extra={"path": scope["path"], "status": status, "total_ms": total_ms, "timings": fields},
+                    )
+                request_timings.reset(token)
+
+
+app.add_middleware(ServerTimingMiddleware)
+
+
+class ConcurrencyLimiter:
+    """Bound concurrent graph runs; callers beyond the queue limit get HTTP 429."""
+
+    def __init__(self, max_concurrent: int, max_queued: int):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queued:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=429,
+                    detail={
+                        "error": "Too many requests in progress, retry later",
+                        "in_flight": self.in_flight,
+                        "queue_depth": self.waiting,
+                    },
+                    headers={"Retry-After": "1", "X-Queue-Depth": str(self.waiting)},
+                )
+            self.waiting += 1
+            queued_at = time.perf_counter()
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+                record_stage("queue", (time.perf_counter() - queued_at) * 1000)
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+
+limiter = ConcurrencyLimiter(MAX_CONCURRENT_REQUESTS, MAX_QUEUED_REQUESTS)
+
+COALESCED_REQUESTS = Counter(
+    "langgraph_api_coalesced_requests_total",
+    "Requests answered by joining an identical request already in progress",
+    ["endpoint"])
+
+
+class RequestCoalescer:
+    """Share one execution, and its result or error, among concurrent callers with the same key."""
+
+    def __init__(self):
+        self._inflight: dict = {}
+        self.coalesced = 0
+
+    async def run(self, endpoint: str, key: Hashable, loader: Callable[[], Awaitable]):
+        if not COALESCE_REQUESTS:
+            return await loader()
+
+        task = self._inflight.get((endpoint, key))
+        if task is None:
+            task = asyncio.ensure_future(self._load((endpoint, key), loader))
+            self._inflight[(endpoint, key)] = task
+        else:
+            self.coalesced += 1
+            COALESCED_REQUESTS.labels(endpoint).inc()
+            logger.info("Coalesced %s request with one already in progress", endpoint)
+            with timed("coalesced", endpoint):
+                return await asyncio.shield(task)
+        # Shield so a disconnected caller does not cancel the work for the others
+        return await asyncio.shield(task)
+
+    async def _load(self, inflight_key: tuple, loader: Callable[[], Awaitable]):
+        try:
+            return await loader()
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+
+coalescer = RequestCoalescer()
+
+
+def normalize_question(question: str) -> str:
+    """Case, whitespace and trailing punctuation do not change the answer."""
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+def question_entities(question: str) -> frozenset:
+    """Emails and numbers in a question; similar questions about different customers must not share answers."""
+    return frozenset(re.findall(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+|\d+", question.lower()))
+
+
+class LocalCacheBackend:
+    """In-process TTL + LRU store. Each worker process has its own copy."""
+
+    def __init__(self, max_entries: int, candidates: int):
+        self.max_entries = max_entries
+        self.candidates = candidates
+        # key -> (expires_at, entry)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _purge(self, now: float):
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+
+    async def get(self, key: str) -> Optional[dict]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        if item[0] <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return item[1]
+
+    async def set(self, key: str, entry: dict, ttl: float):
+        self._entries[key] = (time.time() + ttl, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def similar(self, entities: list) -> list:
+        """(key, embedding) of the most recently used entries about the same entities."""
+        now = time.time()
+        found = []
+        for key, (expires_at, entry) in reversed(self._entries.items()):
+            if len(found) >= self.candidates:
+                break
+            if expires_at > now and entry.get("embedding") is not None and entry["entities"] == entities:
+                found.append((key, entry["embedding"]))
+        return found
+
+    async def keys(self) -> list:
+        self._purge(time.time())
+        return list(self._entries)
+
+    async def delete(self, keys: list) -> int:
+        removed = 0
+        for key in keys:
+            removed += self._entries.pop(key, None) is not None
+        return removed
+
+    async def clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        return removed
+
+    async def size(self) -> int:
+        self._purge(time.time())
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """TTL + LRU store in Redis, shared by every worker and replica.
+
+    Embeddings are kept apart from the answers as float32 under their own keys, and each set of
+    entities has a sorted set of its most recent `candidates` questions, so a similarity lookup
+    reads at most that many vectors instead of every cached answer.
+    """
+
+    def __init__(self, url: str, max_entries: int, candidates: int, prefix: str = "langgraph:question-cache:"):
+        import redis.asyncio as redis
+
+        self.max_entries = max_entries
+        self.candidates = candidates
+        self.prefix = prefix
+        # Every key scored by expiry time, for size and purging, and by last use, for eviction
+        self._index = prefix + "index"
+        self._recent = prefix + "recent"
+        self._redis = redis.Redis.from_url(url)
+
+    def _entry_key(self, key: str) -> str:
+        return self.prefix + "entry:" + key
+
+    def _vector_key(self, key: str) -> str:
+        return self.prefix + "vector:" + key
+
+    def _similar_key(self, entities: list) -> str:
+        return self.prefix + "similar:" + ",".join(entities)
+
+    async def get(self, key: str) -> Optional[dict]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._entry_key(key))
+            pipe.zadd(self._recent, {key: time.time()}, xx=True)
+            raw, _ = await pipe.execute()
+        return json_loads(raw) if raw else None
+
+    async def set(self, key: str, entry: dict, ttl: float):
+        now = time.time()
+        px = int(ttl * 1000)
+        embedding = entry.get("embedding")
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._entry_key(key), json.dumps({k: v for k, v in entry.items() if k != "embedding"}), px=px)
+            if embedding is not None and self.candidates > 0:
+                similar = self._similar_key(entry["entities"])
+                pipe.set(self._vector_key(key), array("f", embedding).tobytes(), px=px)
+                pipe.zadd(similar, {key: now})
+                pipe.zremrangebyrank(similar, 0, -self.candidates - 1)
+                pipe.pexpire(similar, px)
+            pipe.zadd(self._index, {key: now + ttl})
+            pipe.zadd(self._recent, {key: now})
+            pipe.zrangebyscore(self._index, "-inf", now)
+            pipe.zcard(self._index)
+            *_, expired, size = await pipe.execute()
+        await self.delete([k.decode() for k in expired])
+        size -= len(expired)
+        if size > self.max_entries:
+            evicted = await self._redis.zpopmin(self._recent, size - self.max_entries)
+            await self.delete([k.decode() for k, _ in evicted])
+
+    async def similar(self, entities: list) -> list:
+        """(key, embedding) of the most recently stored entries about the same entities."""
+        if self.candidates <= 0:
+            return []
+        keys = [k.decode() for k in await self._redis.zrevrange(self._similar_key(entities), 0, self.candidates - 1)]
+        if not keys:
+            return []
+        values = await self._redis.mget([self._vector_key(key) for key in keys])
+        return [(key, array("f", raw).tolist()) for key, raw in zip(keys, values) if raw]
+
+    async def keys(self) -> list:
+        return [k.decode() for k in await self._redis.zrangebyscore(self._index, time.time(), "+inf")]
+
+    async def delete(self, keys: list) -> int:
+        # Stale members of the per-entity sets are skipped on lookup and expire with them
+        if not keys:
+            return 0
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self._index, *keys)
+            pipe.zrem(self._recent, *keys)
+            pipe.delete(*(self._vector_key(key) for key in keys))
+            pipe.delete(*(self._entry_key(key) for key in keys))
+            return (await pipe.execute())[-1]
+
+    async def clear(self) -> int:
+        keys = [k.decode() for k in await self._redis.zrange(self._index, 0, -1)]
+        removed = await self.delete(keys)
+        await self._redis.delete(self._index, self._recent)
+        return removed
+
+    async def size(self) -> int:
+        return await self._redis.zcount(self._index, time.time(), "+inf")
+
+
+class ResponseCache:
+    """Cache of /question answers with an optional embedding-similarity layer, over a pluggable backend."""
+
+    def __init__(self, backend, ttl: float, embeddings=None, threshold: float = 0.95):
+        self.backend = backend
+        self.ttl = ttl
+        self.embeddings = embeddings
+        self.threshold = threshold
+        # Counters are per worker process
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.backend.max_entries > 0
+
+    async def embed(self, key: str) -> Optional[list]:
+        """Unit-length embedding of a normalized question, or None without an embedding model."""
+        if self.embeddings is None:
+            return None
+        try:
+            vector = await self.embeddings.aembed_query(key)
+        except Exception as e:
+            logger.warning("Question embedding failed, using exact cache only: %s", str(e))
+            return None
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    async def get(self, key: str):
+        """Return (answer, age seconds, "exact" | "semantic", embedding); answer is None on a miss.
+
+        An unavailable backend counts as a miss rather than failing the question.
+        """
+        embedding = None
+        try:
+            entry = await self.backend.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry["answer"], time.time() - entry["stored_at"], "exact", None
+
+            embedding = await self.embed(key)
+            if embedding is not None:
+                best, best_score = None, self.threshold
+                for other, vector in await self.backend.similar(sorted(question_entities(key))):
+                    score = sum(a * b for a, b in zip(embedding, vector))
+                    if score >= best_score:
+                        best, best_score = other, score
+                # The best match may have expired or been evicted since
+                entry = await self.backend.get(best) if best is not None else None
+                if entry is not None:
+                    self.semantic_hits += 1
+                    return entry["answer"], time.time() - entry["stored_at"], "semantic", embedding
+        except Exception as e:
+            logger.warning("Question cache lookup failed: %s", str(e))
+
+        self.misses += 1
+        return None, 0.0, None, embedding
+
+    async def put(self, key: str, answer: str, embedding: Optional[list] = None):
+        try:
+            await self.backend.set(key, {
+                "answer": answer,
+                "stored_at": time.time(),
+                "entities": sorted(question_entities(key)),
+                "embedding": embedding,
+            }, self.ttl)
+        except Exception as e:
+            logger.warning("Question cache store failed: %s", str(e))
+
+    async def invalidate(self, key: Optional[str] = None, contains: Optional[str] = None) -> int:
+        """Drop one question, every question mentioning `contains` (e.g. an email), or everything."""
+        if key is None and contains is None:
+            return await self.backend.clear()
+        doomed = [k for k in await self.backend.keys() if k == key or (contains and contains.lower() in k)]
+        return await self.backend.delete(doomed)
+
+    async def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "semantic": self.embeddings is not None,
+            "entries": await self.backend.size(),
+            "max_entries": self.backend.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+
+question_cache = ResponseCache(
+    RedisCacheBackend(QUESTION_CACHE_URL, QUESTION_CACHE_MAX_ENTRIES, QUESTION_CACHE_SEMANTIC_CANDIDATES)
+    if QUESTION_CACHE_URL else LocalCacheBackend(QUESTION_CACHE_MAX_ENTRIES, QUESTION_CACHE_SEMANTIC_CANDIDATES),
+    QUESTION_CACHE_TTL_SECONDS,
+    embeddings=OpenAIEmbeddings(
+        model=QUESTION_CACHE_EMBEDDING_MODEL,
+        openai_api_key=API_KEY,
+        base_url=f"{BASE_URL}/v1/openai/v1",
+        check_embedding_ctx_length=False,
+    ) if QUESTION_CACHE_EMBEDDING_MODEL else None,
+    threshold=QUESTION_CACHE_SIMILARITY_THRESHOLD,
+)
+
+
+def record_mcp_calls(response):
+    """Note the MCP calls Llama Stack made for this answer in the request timings and span.
+
+    Responses API mcp_call items carry no timing, so they are listed without a duration;
+    their time is included in the "llm" stage.
+    """
+    span = trace.get_current_span() if tracer else None
+    for m in response.get("messages", []):
+        if not isinstance(getattr(m, "content", None), list):
+            continue
+        for item in m.content:
+            if isinstance(item, dict) and item.get("type") == "mcp_call":
+                record_stage(f"mcp.{item.get('name')}", None, item.get("server_label"))
+                if span is not None:
+                    span.add_event("mcp_call", {
+                        "mcp.server": item.get("server_label") or "",
+                        "mcp.tool": item.get("name") or "",
+                        "error": bool(item.get("error")),
+                    })
+
+
+async def run_graph(content: str):
+    """Run the chatbot graph for one user message, within the concurrency limit."""
+    async with limiter.slot():
+        with timed("llm", INFERENCE_MODEL, **{"gen_ai.request.model": INFERENCE_MODEL or ""}):
+            response = await graph.ainvoke({"messages": [{"role": "user", "content": content}]})
+            record_mcp_calls(response)
+    return response
 
 
 # Response models
@@ -126,138 +828,467 @@ class InvoicesResponse(BaseModel):
     total_invoices: int = 0
 
 
+class CustomerSearchOutput(BaseModel):
+    results: list[Customer] = []
+
+
+# data is required so outputs keyed differently (e.g. "orders") fail the fast path and
+# fall back to the generic parse instead of validating as an empty history
+class OrderHistoryOutput(BaseModel):
+    data: list[Order]
+
+
+class InvoiceHistoryOutput(BaseModel):
+    data: list[Invoice]
+
+
+class BulkOrdersRequest(BaseModel):
+    # Plain strings: each address is validated on its own so a bad one fails only its line
+    emails: list[str] = Field(..., min_length=1)
+
+
+EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+
+class BulkOrdersResult(OrdersResponse):
+    email: str
+    lookup_mode: Optional[str] = None
+    error: Optional[str] = None
+
+
+# (server_label, tool) -> what its output holds; other MCP calls are never parsed
+MCP_OUTPUT_KINDS = {
+    ("customer_mcp", "search_customers"): "customer",
+    ("customer_mcp", "get_customer"): "customer",
+    ("customer_mcp", "get_customers"): "customer",
+    ("finance_mcp", "fetch_order_history"): "orders",
+    ("finance_mcp", "fetch_invoice_history"): "invoices",
+}
+
+HISTORY_OUTPUT_MODELS = {"orders": OrderHistoryOutput, "invoices": InvoiceHistoryOutput}
+HISTORY_ROW_ADAPTERS = {"orders": TypeAdapter(list[Order]), "invoices": TypeAdapter(list[Invoice])}
+
+
+def decode_rows(rows) -> list:
+    """Records from an MCP list result in records, columns or csv format"""
+    if isinstance(rows, dict) and "columns" in rows and "rows" in rows:
+        return [dict(zip(rows["columns"], row)) for row in rows["rows"]]
+    if isinstance(rows, str):
+        return list(csv.DictReader(io.StringIO(rows)))
+    return rows or []
+
+
+def parse_customer(output: Union[str, bytes, dict]) -> Optional[Customer]:
+    """First customer in a search_customers or get_customers result, or the get_customer record"""
+    if isinstance(output, (str, bytes)):
+        output = json_loads(output)
+    if "results" in output:
+        # get_customers reports IDs it could not fetch as entries with an error
+        results = [row for row in decode_rows(output["results"]) if "error" not in row]
+        return Customer(**results[0]) if results else None
+    return Customer(**output) if output.get("customerId") else None
+
+
+def parse_history(output: Union[str, bytes, dict], data_type: str) -> list:
+    """Orders or invoices from a finance MCP result, validated as one list"""
+    if isinstance(output, (str, bytes)):
+        try:
+            # Parse and validate the common records format in a single pass
+            return HISTORY_OUTPUT_MODELS[data_type].model_validate_json(output).data
+        except ValidationError:
+            output = json_loads(output)
+    return HISTORY_ROW_ADAPTERS[data_type].validate_python(decode_rows(output.get("data") or output.get(data_type)))
+
+
 def extract_customer_and_data(response, data_type="orders"):
-    """Extract customer info and orders/invoices from graph response"""
+    """Extract the customer and their orders/invoices from the graph's MCP calls.
+
+    Walks the messages newest first and parses only the latest customer lookup and the
+    latest history call of the requested type.
+    """
     customer_info = None
     data_list = []
+    wanted = {"customer", data_type}
+
+    for m in reversed(response['messages']):
+        if not wanted:
+            break
+        if not isinstance(getattr(m, 'content', None), list):
+            continue
+        for item in reversed(m.content):
+            if not (isinstance(item, dict) and item.get('type') == 'mcp_call' and item.get('output')):
+                continue
+            kind = MCP_OUTPUT_KINDS.get((item.get('server_label'), item.get('name')))
+            if kind not in wanted:
+                continue
+            wanted.discard(kind)
+            try:
+                if kind == "customer":
+                    customer_info = parse_customer(item['output'])
+                else:
+                    data_list = parse_history(item['output'], data_type)
+            except (ValueError, ValidationError) as e:
+                logger.warning("Could not parse %s output: %s", item.get('name'), str(e))
 
-    for m in response['messages']:
-        if hasattr(m, 'content') and isinstance(m.content, list):
-            for item in m.content:
-                if isinstance(item, dict) and item.get('type') == 'mcp_call' and item.get('output'):
-                    try:
-                        output_data = json.loads(item['output'])
+    return customer_info, data_list
 
-                        # Check if this is customer search results
-                        if 'results' in output_data and output_data.get('results'):
-                            customer_info = output_data['results'][0] if output_data['results'] else None
 
-                        # Check if this is data (orders or invoices)
-                        if 'data' in output_data and output_data.get('data'):
-                            data_list = output_data['data']
-                        elif data_type in output_data and output_data.get(data_type):
-                            data_list = output_data[data_type]
+async def direct_lookup(email: str, data_type: str):
+    """Find the customer by email, then their orders or invoices, by calling the MCP tools in sequence"""
+    search = await customer_mcp.call("search_customers", {"contact_email": email})
+    customer_info = next(
+        (customer for customer in decode_rows(search.get("results"))
+         if (customer.get("contactEmail") or "").lower() == email.lower()),
+        None
+    )
+    if customer_info is None:
+        return None, []
 
-                    except json.JSONDecodeError:
-                        logger.warning("Could not parse tool output")
+    customer_id = customer_info["customerId"]
+    # One call for the whole history: the finance server re-reads every earlier row for each
+    # cursor page. Ask for one row past the cap to tell a complete history from a truncated one
+    tool = "fetch_order_history" if data_type == "orders" else "fetch_invoice_history"
+    history = await finance_mcp.call(tool, {"customer_id": customer_id, "limit": DIRECT_LOOKUP_MAX_ROWS + 1})
+    with timed("extract"):
+        records = parse_history(history, data_type)
+    if len(records) > DIRECT_LOOKUP_MAX_ROWS or history.get("next_cursor"):
+        raise HTTPException(
+            status_code=502,
+            detail=f"Customer {customer_id} has more than {DIRECT_LOOKUP_MAX_ROWS} {data_type} "
+                   f"(DIRECT_LOOKUP_MAX_ROWS); refusing to return a partial history"
+        )
+    return Customer(**customer_info), records
+
+
+async def find_customer_data(email: str, data_type: str):
+    """Look up a customer's orders or invoices, directly when possible, else through the LLM graph.
+
+    Returns (customer, records, lookup_mode) where records are Order or Invoice models and
+    lookup_mode is "direct" or "graph". Concurrent lookups of the same email share one execution.
+    """
+    return await coalescer.run(f"find_{data_type}", email.lower(), lambda: lookup_customer_data(email, data_type))
 
-    return customer_info, data_list
+
+async def lookup_customer_data(email: str, data_type: str):
+    if DIRECT_LOOKUP:
+        try:
+            customer_info, data = await direct_lookup(email, data_type)
+            return customer_info, data, "direct"
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.warning("Direct %s lookup failed, falling back to the LLM: %s", data_type, str(e))
+
+    graph_response = await run_graph(f"Find all {data_type} for {email}")
+    with timed("extract"):
+        customer_info, data = extract_customer_and_data(graph_response, data_type)
+    return customer_info, data, "graph"
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {
         "message": "Customer Orders and Invoices API",
         "endpoints": {
             "find_orders": "/find_orders?email=<customer_email>",
+            "find_orders_bulk": "POST /find_orders/bulk {\"emails\": [...]}",
             "find_invoices": "/find_invoices?email=<customer_email>",
-            "question": "/question?q=<your_question>"
+            "question": "/question?q=<your_question>",
+            "question_stream": "/question/stream?q=<your_question>"
         }
     }
 
 
+@app.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and serving requests"""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness: warmup against the LLM has succeeded"""
+    ready = warmup_status["state"] in ("ready", "disabled")
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "warmup": warmup_status, "uptime_seconds": round(time.monotonic() - PROCESS_START, 3)},
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Aggregate across all gunicorn workers, not just the one answering
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/find_orders", response_model=OrdersResponse)
-def find_orders(email: EmailStr):
+async def find_orders(email: EmailStr):
     """Find all orders for a customer by email address"""
     logger.info("=" * 80)
     logger.info("API: Finding orders for: %s", email)
     logger.info("=" * 80)
 
     try:
-        response = graph.invoke(
-            {"messages": [{"role": "user", "content": f"Find all orders for {email}"}]})
-
-        customer_info, orders = extract_customer_and_data(response, "orders")
+        customer, orders, lookup_mode = await find_customer_data(email, "orders")
 
-        return OrdersResponse(
-            customer=Customer(**customer_info) if customer_info else None,
-            orders=[Order(**order) for order in orders],
-            total_orders=len(orders)
-        )
+        # Serialize here rather than in FastAPI so the time shows up in Server-Timing
+        with timed("serialize"):
+            body = OrdersResponse(
+                customer=customer,
+                orders=orders,
+                total_orders=len(orders)
+            ).model_dump_json()
+        return Response(body, media_type="application/json", headers={"X-Lookup-Mode": lookup_mode})
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error finding orders: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error finding orders: {str(e)}")
 
 
+@app.post("/find_orders/bulk")
+async def find_orders_bulk(body: BulkOrdersRequest):
+    """Find orders for many customers, streaming one NDJSON line per email as each lookup finishes"""
+    if len(body.emails) > BULK_MAX_EMAILS:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_EMAILS} emails per request")
+
+    logger.info("=" * 80)
+    logger.info("API: Finding orders for %s customers", len(body.emails))
+    logger.info("=" * 80)
+
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def lookup(email: str) -> BulkOrdersResult:
+        try:
+            EMAIL_ADAPTER.validate_python(email)
+        except ValidationError as e:
+            return BulkOrdersResult(email=email, error=f"Invalid email address: {e.errors()[0]['msg']}")
+        async with semaphore:
+            try:
+                customer, orders, lookup_mode = await find_customer_data(email, "orders")
+                return BulkOrdersResult(
+                    email=email,
+                    customer=customer,
+                    orders=orders,
+                    total_orders=len(orders),
+                    lookup_mode=lookup_mode,
+                )
+            except Exception as e:
+                # One failed customer must not fail the batch
+                detail = e.detail if isinstance(e, HTTPException) else e
+                if isinstance(detail, dict):
+                    detail = detail.get("error", detail)
+                logger.warning("Bulk order lookup failed for %s: %s", email, str(detail))
+                return BulkOrdersResult(email=email, error=str(detail))
+
+    async def results():
+        start = time.perf_counter()
+        failed = 0
+        tasks = [asyncio.create_task(lookup(email)) for email in body.emails]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                failed += result.error is not None
+                yield result.model_dump_json() + "\n"
+        finally:
+            # Stop outstanding lookups if the client disconnects
+            for task in tasks:
+                task.cancel()
+        logger.info("Bulk order lookup finished: %s customers, %s failed, %.2fs",
+                    len(tasks), failed, time.perf_counter() - start)
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @app.get("/find_invoices", response_model=InvoicesResponse)
-def find_invoices(email: EmailStr):
+async def find_invoices(email: EmailStr):
     """Find all invoices for a customer by email address"""
     logger.info("=" * 80)
     logger.info("API: Finding invoices for: %s", email)
     logger.info("=" * 80)
 
     try:
-        response = graph.invoke(
-            {"messages": [{"role": "user", "content": f"Find all invoices for {email}"}]})
-
-        customer_info, invoices = extract_customer_and_data(response, "invoices")
+        customer, invoices, lookup_mode = await find_customer_data(email, "invoices")
 
         # Enrich invoices with customer info
-        enriched_invoices = []
-        for invoice in invoices:
-            if customer_info:
-                invoice['customerId'] = invoice.get('customerId', customer_info.get('customerId'))
-                invoice['customerEmail'] = invoice.get('customerEmail', customer_info.get('contactEmail'))
-                invoice['contactName'] = customer_info.get('contactName')
-            enriched_invoices.append(Invoice(**invoice))
-
-        return InvoicesResponse(
-            customer=Customer(**customer_info) if customer_info else None,
-            invoices=enriched_invoices,
-            total_invoices=len(invoices)
-        )
+        if customer:
+            for invoice in invoices:
+                invoice.customerId = invoice.customerId or customer.customerId
+                invoice.customerEmail = invoice.customerEmail or customer.contactEmail
+                invoice.contactName = customer.contactName
 
+        with timed("serialize"):
+            body = InvoicesResponse(
+                customer=customer,
+                invoices=invoices,
+                total_invoices=len(invoices)
+            ).model_dump_json()
+        return Response(body, media_type="application/json", headers={"X-Lookup-Mode": lookup_mode})
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error finding invoices: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error finding invoices: {str(e)}")
 
 
+def answer_text(response) -> Optional[str]:
+    """Text of the AI's final message, or None if the graph produced none"""
+    if response and 'messages' in response and len(response['messages']) > 0:
+        last_message = response['messages'][-1]
+        if hasattr(last_message, 'content'):
+            # Handle both string content and list content
+            if isinstance(last_message.content, str):
+                return last_message.content
+            elif isinstance(last_message.content, list):
+                # Extract text from list content
+                text_parts = []
+                for item in last_message.content:
+                    if isinstance(item, dict) and item.get('type') == 'text':
+                        text_parts.append(item.get('text', ''))
+                    elif isinstance(item, str):
+                        text_parts.append(item)
+                return " ".join(text_parts)
+    return None
+
+
+async def ask_graph(q: str) -> Optional[str]:
+    response = await run_graph(q)
+    with timed("extract"):
+        return answer_text(response)
+
+
 @app.get("/question")
-def ask_question(q: str):
+async def ask_question(q: str, request: Request, response: Response):
     """Answer a natural language question using the LangGraph chatbot"""
     logger.info("=" * 80)
     logger.info("API: Processing question: %s", q)
     logger.info("=" * 80)
 
     try:
-        response = graph.invoke(
-            {"messages": [{"role": "user", "content": q}]})
-
-        # Extract the AI's response from the messages
-        if response and 'messages' in response and len(response['messages']) > 0:
-            last_message = response['messages'][-1]
-            if hasattr(last_message, 'content'):
-                # Handle both string content and list content
-                if isinstance(last_message.content, str):
-                    return {"question": q, "answer": last_message.content}
-                elif isinstance(last_message.content, list):
-                    # Extract text from list content
-                    text_parts = []
-                    for item in last_message.content:
-                        if isinstance(item, dict) and item.get('type') == 'text':
-                            text_parts.append(item.get('text', ''))
-                        elif isinstance(item, str):
-                            text_parts.append(item)
-                    return {"question": q, "answer": " ".join(text_parts)}
-
-        return {"question": q, "answer": "No response generated"}
+        # Cache-Control: no-cache skips the lookup but still refreshes the entry
+        use_cache = question_cache.enabled
+        read_cache = use_cache and "no-cache" not in request.headers.get("cache-control", "").lower()
+        key = normalize_question(q)
+        embedding = None
+        if read_cache:
+            with timed("cache"):
+                answer, age, match, embedding = await question_cache.get(key)
+            if answer is not None:
+                logger.info("Question cache hit (%s, age %.1fs)", match, age)
+                response.headers["X-Cache"] = f"HIT-{match.upper()}"
+                response.headers["Age"] = str(int(age))
+                return {"question": q, "answer": answer}
+
+        answer = await coalescer.run("question", key, lambda: ask_graph(q))
+        if answer is None:
+            response.headers["X-Cache"] = "MISS" if read_cache else "BYPASS"
+            return {"question": q, "answer": "No response generated"}
 
+        if use_cache:
+            if embedding is None:
+                embedding = await question_cache.embed(key)
+            await question_cache.put(key, answer, embedding)
+        response.headers["X-Cache"] = "MISS" if read_cache else "BYPASS"
+        return {"question": q, "answer": answer}
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error processing question: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
 
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/question/stream")
+async def ask_question_stream(q: str):
+    """Answer a question as Server-Sent Events: token, tool_call and a final done (or error) event"""
+    logger.info("=" * 80)
+    logger.info("API: Streaming question: %s", q)
+    logger.info("=" * 80)
+
+    # Take the concurrency slot before responding so an overloaded service still answers 429
+    slot = AsyncExitStack()
+    await slot.enter_async_context(limiter.slot())
+    start = time.perf_counter()
+
+    async def events():
+        first_token_ms = None
+        text_parts = []
+        try:
+            async with slot:
+                async for event in graph.astream_events(
+                    {"messages": [{"role": "user", "content": q}]}, version="v2"
+                ):
+                    if event["event"] != "on_chat_model_stream":
+                        continue
+                    content = event["data"]["chunk"].content
+                    if isinstance(content, str):
+                        content = [{"type": "text", "text": content}] if content else []
+                    for item in content:
+                        if not isinstance(item, dict):
+                            continue
+                        if item.get("type") == "text" and item.get("text"):
+                            data = {"text": item["text"]}
+                            if first_token_ms is None:
+                                first_token_ms = round((time.perf_counter() - start) * 1000, 1)
+                                data["ttft_ms"] = first_token_ms
+                                logger.info("Time to first token: %.1f ms", first_token_ms)
+                            text_parts.append(item["text"])
+                            yield sse_event("token", data)
+                        elif item.get("type") == "mcp_call":
+                            yield sse_event("tool_call", {
+                                "server_label": item.get("server_label"),
+                                "name": item.get("name"),
+                                "arguments": item.get("arguments"),
+                                "status": "failed" if item.get("error") else "completed",
+                                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                            })
+
+            total_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.info("Streamed answer in %.1f ms", total_ms)
+            yield sse_event("done", {
+                "question": q,
+                "answer": "".join(text_parts) or "No response generated",
+                "ttft_ms": first_token_ms,
+                "total_ms": total_ms,
+            })
+        except Exception as e:
+            logger.error("Error streaming question: %s", str(e))
+            yield sse_event("error", {"detail": f"Error processing question: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Frees the slot if the client disconnects before the stream starts
+        background=BackgroundTask(slot.aclose),
+    )
+
+
+@app.get("/question/cache")
+async def question_cache_stats():
+    """Hit/miss counters and size of the /question answer cache"""
+    return await question_cache.stats()
+
+
+@app.delete("/question/cache")
+async def invalidate_question_cache(q: Optional[str] = None, contains: Optional[str] = None):
+    """Drop cached answers: one question (q), those mentioning a term such as an email (contains), or all"""
+    removed = await question_cache.invalidate(normalize_question(q) if q else None, contains)
+    logger.info("Question cache invalidated: %s entries removed", removed)
+    return {"removed": removed, "entries": await question_cache.backend.size()}
+
+
 if __name__ == "__main__":
+    # Single process for development; see gunicorn.conf.py for multi-worker deployments
     import uvicorn
     uvicorn.run(app, host=FASTAPI_HOST, port=FASTAPI_PORT)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling benchmark for the LangGraph FastAPI service under gunicorn
+
+Starts a fake Llama Stack Responses API that answers every request with a large
+order history, then for each worker count starts the service with gunicorn and
+drives /find_orders through the LLM graph path at a fixed concurrency. Parsing
+and validating the history is CPU-bound, so requests per second should grow with
+the number of workers until the CPUs are used up.
+
+Usage:
+    python benchmark_workers.py --workers 1,2,4 --concurrency 32 --duration 20
+    python benchmark_workers.py --workers 1,2 --orders 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FAKE_ORDERS = int(os.getenv("BENCH_FAKE_ORDERS", "2000"))
+FAKE_LATENCY_MS = float(os.getenv("BENCH_FAKE_LATENCY_MS", "0"))
+EMAIL = "thomashardy@example.com"
+
+_fake_body = None
+
+
+def fake_response_body(orders: int) -> bytes:
+    """A Responses API result with a customer search and an order history of `orders` rows."""
+    customer = {
+        "customerId": "AROUT",
+        "companyName": "Around the Horn",
+        "contactName": "Thomas Hardy",
+        "contactEmail": EMAIL,
+    }
+    history = [
+        {
+            "id": i,
+            "orderNumber": f"ORD-AROUT-{i:05d}",
+            "customerId": "AROUT",
+            "status": "SHIPPED",
+            "totalAmount": round(10 + i * 1.37, 2),
+            "orderDate": "2024-01-01T00:00:00",
+        }
+        for i in range(orders)
+    ]
+    output = [
+        {
+            "type": "mcp_call", "id": "mcp_1", "server_label": "customer_mcp", "name": "search_customers",
+            "arguments": json.dumps({"contact_email": EMAIL}),
+            "output": json.dumps({"results": [customer]}),
+        },
+        {
+            "type": "mcp_call", "id": "mcp_2", "server_label": "finance_mcp", "name": "fetch_order_history",
+            "arguments": json.dumps({"customer_id": "AROUT"}),
+            "output": json.dumps({"success": True, "data": history, "count": len(history)}),
+        },
+        {
+            "type": "message", "id": "msg_1", "role": "assistant", "status": "completed",
+            "content": [{"type": "output_text", "text": f"Found {orders} orders.", "annotations": []}],
+        },
+    ]
+    return json.dumps({
+        "id": "resp_1", "object": "response", "created_at": int(time.time()), "model": "fake",
+        "status": "completed", "output": output, "parallel_tool_calls": True, "tool_choice": "auto", "tools": [],
+        "usage": {
+            "input_tokens": 10, "output_tokens": 5, "total_tokens": 15,
+            "input_tokens_details": {"cached_tokens": 0}, "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }).encode()
+
+
+async def fake_llm_app(scope, receive, send):
+    """Minimal ASGI app standing in for Llama Stack's /v1/openai/v1/responses."""
+    global _fake_body
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body"):
+        pass
+    if _fake_body is None:
+        _fake_body = fake_response_body(FAKE_ORDERS)
+    if FAKE_LATENCY_MS:
+        await asyncio.sleep(FAKE_LATENCY_MS / 1000)
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": _fake_body})
+
+
+def start_process(cmd: List[str], env: Dict[str, str], log_path: str) -> subprocess.Popen:
+    log = open(log_path, "w")
+    return subprocess.Popen(cmd, cwd=HERE, env=env, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+
+
+def stop_process(proc: subprocess.Popen):
+    if proc.poll() is not None:
+        return
+    os.killpg(proc.pid, signal.SIGTERM)
+    try:
+        proc.wait(timeout=20)
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+
+
+async def wait_ready(url: str, timeout: float):
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(timeout=5) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"{url} not ready after {timeout}s")
+
+
+async def drive(base_url: str, concurrency: int, duration: float = 0, requests: int = 0):
+    """Send /find_orders back to back from `concurrency` clients; returns (latencies, errors, elapsed)."""
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        start = time.perf_counter()
+        deadline = start + duration if duration else None
+
+        def should_continue() -> bool:
+            nonlocal issued
+            if deadline is not None:
+                return time.perf_counter() < deadline
+            issued += 1
+            return issued <= requests
+
+        async def user():
+            nonlocal errors
+            while should_continue():
+                sent = time.perf_counter()
+                try:
+                    response = await client.get("/find_orders", params={"email": EMAIL})
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - sent)
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure LangGraph FastAPI throughput against gunicorn worker count")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts to try (default: 1,2,4)")
+    parser.add_argument("--concurrency", "-c", type=int, default=32, help="Concurrent clients (default: 32)")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to measure per worker count (default: 15)")
+    parser.add_argument("--orders", type=int, default=FAKE_ORDERS,
+                        help=f"Orders in each fake LLM response (default: {FAKE_ORDERS})")
+    parser.add_argument("--port", type=int, default=8100, help="Port for the service under test (default: 8100)")
+    parser.add_argument("--fake-llm-port", type=int, default=8101, help="Port for the fake LLM (default: 8101)")
+    parser.add_argument("--fake-llm-workers", type=int, default=2,
+                        help="Processes serving the fake LLM, so it is not the bottleneck (default: 2)")
+    parser.add_argument("--log-dir", default="/tmp", help="Where server logs are written (default: /tmp)")
+    args = parser.parse_args()
+
+    worker_counts = [int(n) for n in args.workers.split(",") if n.strip()]
+    env = dict(os.environ, BENCH_FAKE_ORDERS=str(args.orders))
+
+    fake_llm = start_process(
+        [sys.executable, "-m", "uvicorn", "benchmark_workers:fake_llm_app", "--host", "127.0.0.1",
+         "--port", str(args.fake_llm_port), "--workers", str(args.fake_llm_workers),
+         "--lifespan", "off", "--log-level", "warning", "--no-access-log"],
+        env, os.path.join(args.log_dir, "benchmark-fake-llm.log"))
+
+    service_env = dict(
+        env,
+        FASTAPI_HOST="127.0.0.1",
+        FASTAPI_PORT=str(args.port),
+        LLAMA_STACK_BASE_URL=f"http://127.0.0.1:{args.fake_llm_port}",
+        INFERENCE_MODEL="fake",
+        API_KEY="fake",
+        CUSTOMER_MCP_SERVER_URL="http://127.0.0.1:9/mcp",
+        FINANCE_MCP_SERVER_URL="http://127.0.0.1:9/mcp",
+        # Measure the graph path: LLM response parsing, extraction and validation
+        DIRECT_LOOKUP="false",
+        QUESTION_CACHE_TTL_SECONDS="0",
+        # Every request asks for the same email; coalescing would answer most of them from one
+        COALESCE_REQUESTS="false",
+        MAX_CONCURRENT_REQUESTS=str(args.concurrency),
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    rows = []
+    try:
+        for workers in worker_counts:
+            print(f"Starting service with {workers} worker(s)...", flush=True)
+            service = start_process(
+                ["gunicorn", "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null", "9_langgraph_fastapi:app"],
+                dict(service_env, WEB_CONCURRENCY=str(workers)),
+                os.path.join(args.log_dir, f"benchmark-service-{workers}.log"))
+            try:
+                asyncio.run(wait_ready(f"{base_url}/readyz", 120))
+                # Warm every worker before measuring
+                asyncio.run(drive(base_url, args.concurrency, requests=args.concurrency * 4))
+                latencies, errors, elapsed = asyncio.run(drive(base_url, args.concurrency, duration=args.duration))
+            finally:
+                stop_process(service)
+            rows.append((workers, latencies, errors, elapsed))
+    finally:
+        stop_process(fake_llm)
+
+    print("\n" + "=" * 78)
+    print(f"WORKER SCALING - {args.orders} orders per response, concurrency {args.concurrency}, "
+          f"{args.duration:.0f}s per run, {os.cpu_count()} CPUs")
+    print("=" * 78)
+    print(f"{'workers':>8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+          f"{'mean ms':>10}{'speedup':>10}")
+    print("-" * 78)
+    baseline = None
+    for workers, latencies, errors, elapsed in rows:
+        if not latencies:
+            print(f"{workers:>8}{0:>10}{errors:>8}  no successful requests")
+            continue
+        throughput = len(latencies) / elapsed
+        baseline = baseline or throughput
+        ms = [latency * 1000 for latency in latencies]
+        print(f"{workers:>8}{len(latencies):>10}{errors:>8}{throughput:>10.1f}{percentile(ms, 50):>10.1f}"
+              f"{percentile(ms, 95):>10.1f}{statistics.mean(ms):>10.1f}{throughput / baseline:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,48 @@
+"""
+Gunicorn settings for running the LangGraph FastAPI service with several worker processes
+
+Each worker is a separate process with its own event loop, so CPU-bound work such as
+parsing and validating large order histories runs in parallel instead of behind the GIL.
+
+Usage:
+    gunicorn -c gunicorn.conf.py 9_langgraph_fastapi:app
+    WEB_CONCURRENCY=4 gunicorn -c gunicorn.conf.py 9_langgraph_fastapi:app
+"""
+
+import os
+import shutil
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = f"{os.getenv('FASTAPI_HOST', '0.0.0.0')}:{os.getenv('FASTAPI_PORT', '8000')}"
+
+# Defaults to the CPUs this process may run on; set WEB_CONCURRENCY to match the container CPU limit
+cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+workers = int(os.getenv("WEB_CONCURRENCY", cpus))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Every worker imports the app itself and runs its own lifespan warmup, so LLM and MCP
+# clients are never shared across a fork
+preload_app = False
+
+# Graph runs can take a while; a worker silent for longer than this is restarted
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+accesslog = "-"
+
+
+def on_starting(server):
+    # Start each run with empty multiprocess metric files
+    metrics_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
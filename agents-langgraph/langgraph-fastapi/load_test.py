@@ -1,29 +1,70 @@
 #!/usr/bin/env python3
 """
 Load test script for the FastAPI LangGraph API.
+
+Closed-loop mode (default) sends the queries from a fixed number of workers, each
+starting its next request when the previous one returns. Open-loop mode (--rate)
+sends requests at a target arrival rate regardless of how fast the service answers,
+and measures latency from each request's scheduled send time, so queueing delay is
+not hidden when the service falls behind (coordinated omission).
+
+The default engine uses a thread per concurrent request. The async engine
+(--engine async) runs thousands of virtual users on one event loop with pooled
+connections, and --processes shards the load over several processes whose results
+are merged at the end.
+
+--save writes a run's configuration, latency histogram, errors and time series to a
+JSON file, and `load_test.py compare BASELINE CURRENT` tests two saved runs for
+statistically significant latency, throughput and error-rate regressions, exiting
+non-zero when one exceeds the threshold.
+
+--scenario replaces the built-in /question queries with a YAML or JSON traffic mix:
+weighted flows over any endpoint (including multi-turn chat), parameter pools, think
+times, and stages that ramp the number of virtual users up and down.
 """
 
 import requests
+import httpx
 import time
+import asyncio
 import concurrent.futures
 import argparse
-import statistics
 import os
+import csv
+import json
+import math
+import random
+import re
 import logging
+import subprocess
+import sys
+import uuid
+from collections import deque
+from datetime import datetime, timezone
 from urllib.parse import urlencode
 
+try:
+    import yaml
+except ImportError:
+    # Only needed for .yaml scenario files; JSON scenarios work without it
+    yaml = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Default configuration
 SERVICE_URL = os.getenv("SERVICE_URL", "langgraph-fastapi")
 DEFAULT_BASE_URL = f"http://{SERVICE_URL}:8000"
 DEFAULT_CONCURRENT_USERS = 3
 DEFAULT_ITERATIONS = 1
+DEFAULT_DURATION = 60
+DEFAULT_MAX_IN_FLIGHT = 256
 
 # Test queries based on the curl commands
 QUERIES = [
@@ -36,16 +77,24 @@ QUERIES = [
 ]
 
 
-def make_request(base_url: str, query: str) -> dict:
-    """Make a single request to the /question endpoint."""
+def make_request(base_url: str, query: str, scheduled: float = None) -> dict:
+    """Make a single request to the /question endpoint.
+
+    With `scheduled` (a time.perf_counter() value), elapsed is measured from when the
+    request should have been sent rather than from when a worker got to send it.
+    """
     url = f"{base_url}/question"
     params = {"q": query}
 
     logger.debug(f"Sending request: {query}")
-    start_time = time.time()
+    start_time = time.perf_counter()
+    if scheduled is None:
+        scheduled = start_time
+    # Wall-clock time of the scheduled send, comparable across processes
+    sent_at = time.time() - (start_time - scheduled)
     try:
         response = requests.get(url, params=params, timeout=120)
-        elapsed = time.time() - start_time
+        finished = time.perf_counter()
 
         response_data = response.json() if response.status_code == 200 else response.text
         logger.debug(f"Response for '{query[:40]}...': {response_data}")
@@ -53,24 +102,93 @@ def make_request(base_url: str, query: str) -> dict:
         return {
             "query": query,
             "status_code": response.status_code,
-            "elapsed": elapsed,
+            "elapsed": finished - scheduled,
+            "service_time": finished - start_time,
+            "start_lag": start_time - scheduled,
+            "sent_at": sent_at,
             "success": response.status_code == 200,
             "response": response_data,
             "error": None
         }
     except requests.exceptions.RequestException as e:
-        elapsed = time.time() - start_time
+        finished = time.perf_counter()
         logger.debug(f"Request failed for '{query[:40]}...': {e}")
         return {
             "query": query,
             "status_code": None,
-            "elapsed": elapsed,
+            "elapsed": finished - scheduled,
+            "service_time": finished - start_time,
+            "start_lag": start_time - scheduled,
+            "sent_at": sent_at,
             "success": False,
             "response": None,
             "error": str(e)
         }
 
 
+async def send_request_async(client: httpx.AsyncClient, method: str, url: str, label: str,
+                             name: str = None, params: dict = None, json_body=None, expect: int = 200,
+                             scheduled: float = None, keep_response: bool = True) -> dict:
+    """Send one request on the client's connection pool; succeeds when the status is `expect`."""
+    logger.debug(f"Sending request: {label}")
+    start_time = time.perf_counter()
+    if scheduled is None:
+        scheduled = start_time
+    # Wall-clock time of the scheduled send, comparable across processes
+    sent_at = time.time() - (start_time - scheduled)
+    try:
+        response = await client.request(method, url, params=params, json=json_body)
+        finished = time.perf_counter()
+
+        response_data = None
+        if keep_response or logger.isEnabledFor(logging.DEBUG):
+            try:
+                response_data = response.json() if response.status_code == 200 else response.text
+            except ValueError:
+                response_data = response.text
+            logger.debug(f"Response for '{label[:40]}...': {response_data}")
+
+        return {
+            "query": label,
+            "name": name,
+            "status_code": response.status_code,
+            "elapsed": finished - scheduled,
+            "service_time": finished - start_time,
+            "start_lag": start_time - scheduled,
+            "sent_at": sent_at,
+            "success": response.status_code == expect,
+            "response": response_data if keep_response else None,
+            "error": None
+        }
+    except httpx.HTTPError as e:
+        finished = time.perf_counter()
+        logger.debug(f"Request failed for '{label[:40]}...': {e}")
+        return {
+            "query": label,
+            "name": name,
+            "status_code": None,
+            "elapsed": finished - scheduled,
+            "service_time": finished - start_time,
+            "start_lag": start_time - scheduled,
+            "sent_at": sent_at,
+            "success": False,
+            "response": None,
+            "error": str(e) or type(e).__name__
+        }
+
+
+async def make_request_async(client: httpx.AsyncClient, base_url: str, query: str,
+                             scheduled: float = None, keep_response: bool = True) -> dict:
+    """Async version of make_request, sharing the client's connection pool."""
+    return await send_request_async(client, "GET", f"{base_url}/question", query, params={"q": query},
+                                    scheduled=scheduled, keep_response=keep_response)
+
+
+def print_result(result: dict):
+    status = "✓" if result["success"] else "✗"
+    print(f"  {status} {result['elapsed']:.2f}s - {result['query'][:40]}...")
+
+
 def run_sequential_test(base_url: str, queries: list) -> list:
     """Run queries sequentially."""
     results = []
@@ -83,7 +201,7 @@ def run_sequential_test(base_url: str, queries: list) -> list:
     return results
 
 
-def run_concurrent_test(base_url: str, queries: list, max_workers: int) -> list:
+def run_concurrent_test(base_url: str, queries: list, max_workers: int, quiet: bool = False) -> list:
     """Run queries concurrently."""
     results = []
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -96,8 +214,8 @@ def run_concurrent_test(base_url: str, queries: list, max_workers: int) -> list:
             query = future_to_query[future]
             try:
                 result = future.result()
-                status = "✓" if result["success"] else "✗"
-                print(f"  {status} {result['elapsed']:.2f}s - {query[:40]}...")
+                if not quiet:
+                    print_result(result)
                 results.append(result)
             except Exception as e:
                 print(f"  ✗ Error: {e}")
@@ -105,6 +223,9 @@ def run_concurrent_test(base_url: str, queries: list, max_workers: int) -> list:
                     "query": query,
                     "status_code": None,
                     "elapsed": 0,
+                    "service_time": 0,
+                    "start_lag": 0,
+                    "sent_at": time.time(),
                     "success": False,
                     "response": None,
                     "error": str(e)
@@ -112,6 +233,849 @@ def run_concurrent_test(base_url: str, queries: list, max_workers: int) -> list:
     return results
 
 
+def arrival_offsets(rate: float, duration: float, arrival: str, seed: int = None) -> list:
+    """Send times in seconds from the start of the test, at `rate` requests per second."""
+    rng = random.Random(seed)
+    offsets = []
+    t = 0.0
+    while True:
+        # Poisson arrivals have exponentially distributed gaps with the same mean
+        t += rng.expovariate(rate) if arrival == "poisson" else 1.0 / rate
+        if t >= duration:
+            return offsets
+        offsets.append(t)
+
+
+def run_open_loop_test(base_url: str, queries: list, rate: float, duration: float,
+                       arrival: str, max_in_flight: int, seed: int = None, quiet: bool = False) -> list:
+    """Send queries at a target arrival rate, independent of response times."""
+    offsets = arrival_offsets(rate, duration, arrival, seed)
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        start = time.perf_counter()
+        futures = []
+        for i, offset in enumerate(offsets):
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(make_request, base_url, queries[i % len(queries)], scheduled))
+
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            if not quiet:
+                print_result(result)
+            results.append(result)
+    return results
+
+
+async def run_async_test(base_url: str, queries: list, concurrency: int, keep_responses: bool,
+                         quiet: bool) -> list:
+    """Closed loop on one event loop: `concurrency` virtual users take queries from a shared queue."""
+    pending = deque(queries)
+    results = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        async def user():
+            while pending:
+                result = await make_request_async(client, base_url, pending.popleft(), keep_response=keep_responses)
+                if not quiet:
+                    print_result(result)
+                results.append(result)
+
+        await asyncio.gather(*(user() for _ in range(min(concurrency, len(queries)))))
+    return results
+
+
+async def run_async_open_loop_test(base_url: str, queries: list, rate: float, duration: float, arrival: str,
+                                   max_in_flight: int, seed: int, keep_responses: bool, quiet: bool,
+                                   start_at: float = None) -> list:
+    """Open loop on one event loop. `start_at` (time.time()) lines up shards in different processes."""
+    offsets = arrival_offsets(rate, duration, arrival, seed)
+    results = []
+    in_flight = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        async def send(query: str, scheduled: float):
+            async with in_flight:
+                result = await make_request_async(client, base_url, query, scheduled, keep_responses)
+            if not quiet:
+                print_result(result)
+            results.append(result)
+
+        start = time.perf_counter()
+        if start_at is not None:
+            start += max(start_at - time.time(), 0)
+        tasks = []
+        for i, offset in enumerate(offsets):
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(queries[i % len(queries)], scheduled)))
+        await asyncio.gather(*tasks)
+    return results
+
+
+def run_shard(shard: dict) -> list:
+    """Entry point of one load-generating process."""
+    if shard["scenario"]:
+        return asyncio.run(run_scenario_test(
+            shard["url"], shard["scenario"], shard["stages"], shard["seed"], shard["keep_responses"],
+            shard["quiet"], shard["start_at"], shard["index"]))
+    if shard["rate"]:
+        return asyncio.run(run_async_open_loop_test(
+            shard["url"], shard["queries"], shard["rate"], shard["duration"], shard["arrival"],
+            shard["max_in_flight"], shard["seed"], shard["keep_responses"], shard["quiet"], shard["start_at"]))
+    return asyncio.run(run_async_test(
+        shard["url"], shard["queries"], shard["concurrency"], shard["keep_responses"], shard["quiet"]))
+
+
+def run_sharded_test(args, queries: list, scenario: dict = None) -> list:
+    """Split the load evenly over --processes processes and merge their results."""
+    processes = args.processes
+    # Let every process start before the open-loop schedule begins
+    start_at = time.time() + 1.0
+    shards = []
+    for i in range(processes):
+        shards.append({
+            "url": args.url,
+            "rate": args.rate / processes if args.rate else None,
+            "duration": args.duration,
+            "arrival": args.arrival,
+            "max_in_flight": max(args.max_in_flight // processes, 1),
+            "seed": None if args.seed is None else args.seed + i,
+            # Closed loop: every process takes its share of the queries and of the users
+            "queries": queries if args.rate else queries[i::processes],
+            "concurrency": args.concurrent // processes + (1 if i < args.concurrent % processes else 0),
+            "keep_responses": args.verbose,
+            "quiet": args.quiet,
+            "start_at": start_at,
+            "scenario": scenario,
+            "stages": split_stages(scenario["stages"], processes, i) if scenario else None,
+            "index": i,
+        })
+    if scenario:
+        shards = [shard for shard in shards if any(stage["users"] for stage in shard["stages"])]
+    else:
+        shards = [shard for shard in shards if shard["queries"] and (shard["rate"] or shard["concurrency"])]
+
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        for shard_results in executor.map(run_shard, shards):
+            results.extend(shard_results)
+    return results
+
+
+def think_time_range(value) -> tuple:
+    """Think time as (min, max) seconds, from a number or a [min, max] pair"""
+    if value is None:
+        return (0.0, 0.0)
+    if isinstance(value, (int, float)):
+        low = high = float(value)
+    else:
+        low, high = (float(v) for v in value)
+    if low < 0 or high < low:
+        raise ValueError(f"think_time {value!r} must be a number or [min, max] with 0 <= min <= max")
+    return (low, high)
+
+
+class FlowVariables(dict):
+    """Placeholder values for one run of a flow.
+
+    Each pool is sampled the first time a step uses it and then kept, so every turn of a
+    conversation is about the same customer. Pool values may contain placeholders themselves.
+    {session} is unique per run of the flow and {user} names the virtual user.
+    """
+
+    def __init__(self, pools: dict, rng: random.Random, user: str):
+        super().__init__(session=uuid.uuid4().hex, user=user)
+        self.pools = pools
+        self.rng = rng
+
+    def __missing__(self, key: str) -> str:
+        if key not in self.pools:
+            raise ValueError(f"unknown placeholder {{{key}}}")
+        # Store the raw value first so a value that names its own pool cannot recurse forever
+        self[key] = self.rng.choice(self.pools[key])
+        self[key] = self[key].format_map(self)
+        return self[key]
+
+
+def render(value, variables: FlowVariables):
+    """Fill placeholders in every string of a (nested) step template"""
+    if isinstance(value, str):
+        return value.format_map(variables)
+    if isinstance(value, dict):
+        return {key: render(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, variables) for item in value]
+    return value
+
+
+def expand_env(value: str) -> str:
+    """Expand $VAR and ${VAR}, plus ${VAR:-default} for variables that are unset or empty"""
+    value = re.sub(r"\$\{(\w+):-([^}]*)\}", lambda match: os.getenv(match.group(1)) or match.group(2), value)
+    return os.path.expandvars(value)
+
+
+def parse_scenario(data: dict, default_name: str) -> dict:
+    if not isinstance(data, dict) or not data.get("flows"):
+        raise ValueError("a scenario needs a non-empty 'flows' list")
+    pools = {name: [str(value) for value in values] for name, values in (data.get("pools") or {}).items()}
+    for name, values in pools.items():
+        if not values:
+            raise ValueError(f"pool '{name}' is empty")
+    think_time = think_time_range(data.get("think_time"))
+
+    flows = []
+    for i, flow in enumerate(data["flows"]):
+        name = flow.get("name") or f"flow{i + 1}"
+        steps = []
+        # A flow is either one request or a list of steps, e.g. the turns of a conversation
+        for step in flow.get("steps") or [flow]:
+            if "path" not in step:
+                raise ValueError(f"flow '{name}': every request needs a 'path'")
+            steps.append({
+                "name": step.get("name") or name,
+                "method": step.get("method", "GET").upper(),
+                "path": step["path"],
+                "params": step.get("params") or {},
+                "json": step.get("json"),
+                "expect": int(step.get("expect", 200)),
+            })
+        weight = float(flow.get("weight", 1))
+        if weight < 0:
+            raise ValueError(f"flow '{name}': weight must not be negative")
+        flows.append({
+            "name": name,
+            "weight": weight,
+            # Flows can target another service, e.g. the Langfuse chatbot's /chat
+            "url": expand_env(flow["url"]).rstrip("/") if flow.get("url") else None,
+            "think_time": think_time_range(flow["think_time"]) if "think_time" in flow else think_time,
+            "steps": steps,
+        })
+    if not any(flow["weight"] > 0 for flow in flows):
+        raise ValueError("at least one flow needs a positive weight")
+
+    stages = []
+    for stage in data.get("stages") or []:
+        duration, users = float(stage["duration"]), int(stage["users"])
+        if duration <= 0 or users < 0:
+            raise ValueError(f"stage {stage!r} needs duration > 0 and users >= 0")
+        stages.append({"duration": duration, "users": users})
+
+    # Catch unknown placeholders before the test starts
+    for flow in flows:
+        render(flow["steps"], FlowVariables(pools, random.Random(0), "check"))
+
+    return {"name": data.get("name") or default_name, "pools": pools, "flows": flows, "stages": stages}
+
+
+def load_scenario(path: str) -> dict:
+    """Read a scenario file (.yaml/.yml or .json) and check it."""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise SystemExit("YAML scenarios need PyYAML (pip install pyyaml), or use a .json file")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    try:
+        return parse_scenario(data, os.path.splitext(os.path.basename(path))[0])
+    except (KeyError, TypeError, ValueError) as e:
+        raise SystemExit(f"{path}: invalid scenario: {e}")
+
+
+def stage_users(stages: list, elapsed: float) -> float:
+    """Virtual users the stages call for `elapsed` seconds into the test.
+
+    Each stage moves linearly from the previous stage's user count (0 before the first) to its
+    own over its duration, so equal counts hold the load and lower ones ramp it down.
+    """
+    previous = 0
+    for stage in stages:
+        if elapsed < stage["duration"]:
+            return previous + (stage["users"] - previous) * elapsed / stage["duration"]
+        elapsed -= stage["duration"]
+        previous = stage["users"]
+    return 0
+
+
+async def run_scenario_test(base_url: str, scenario: dict, stages: list, seed: int, keep_responses: bool,
+                            quiet: bool, start_at: float = None, shard: int = 0) -> list:
+    """Closed loop driven by a scenario on one event loop.
+
+    Virtual users start and stop to follow the stages. Each picks a flow by weight, sends its
+    steps with a think time after each request, and repeats. A user stopped by a ramp-down
+    finishes its current flow first; the end of the test interrupts flows between steps.
+    """
+    flows = scenario["flows"]
+    weights = [flow["weight"] for flow in flows]
+    rng = random.Random(seed)
+    results = []
+    peak = max(max(stage["users"] for stage in stages), 1)
+    limits = httpx.Limits(max_connections=peak, max_keepalive_connections=peak)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        start = time.perf_counter()
+        if start_at is not None:
+            start += max(start_at - time.time(), 0)
+            await asyncio.sleep(start - time.perf_counter())
+        deadline = start + sum(stage["duration"] for stage in stages)
+        target = 0
+
+        async def think(flow: dict, user_rng: random.Random):
+            pause = min(user_rng.uniform(*flow["think_time"]), deadline - time.perf_counter())
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+        async def user(number: int, user_rng: random.Random):
+            while number < target and time.perf_counter() < deadline:
+                flow = user_rng.choices(flows, weights)[0]
+                variables = FlowVariables(scenario["pools"], user_rng, f"loadtest-{shard}-{number}")
+                for step in flow["steps"]:
+                    if time.perf_counter() >= deadline:
+                        return
+                    path = render(step["path"], variables)
+                    result = await send_request_async(
+                        client, step["method"], f"{flow['url'] or base_url}{path}",
+                        f"{step['name']}: {step['method']} {path}", step["name"],
+                        params=render(step["params"], variables), json_body=render(step["json"], variables),
+                        expect=step["expect"], keep_response=keep_responses)
+                    if not quiet:
+                        print_result(result)
+                    results.append(result)
+                    await think(flow, user_rng)
+
+        users = {}
+        while time.perf_counter() < deadline:
+            target = round(stage_users(stages, time.perf_counter() - start))
+            for number in range(target):
+                if number not in users or users[number].done():
+                    users[number] = asyncio.create_task(user(number, random.Random(rng.random())))
+            await asyncio.sleep(0.1)
+        target = 0
+        await asyncio.gather(*users.values())
+    return results
+
+
+def split_stages(stages: list, processes: int, index: int) -> list:
+    """Process `index`'s share of every stage's users"""
+    return [dict(stage, users=stage["users"] // processes + (1 if index < stage["users"] % processes else 0))
+            for stage in stages]
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram with about three significant digits of precision.
+
+    Latencies are recorded in microseconds. Values below 2048us get a bucket each; above that,
+    every power of two is split into 1024 buckets, so a bucket is never wider than 0.1% of its
+    values. Memory stays small however many requests are recorded, and histograms from
+    different processes or runs can be merged.
+    """
+
+    SUB_BUCKET_BITS = 11
+    HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < (1 << cls.SUB_BUCKET_BITS):
+            return micros
+        shift = micros.bit_length() - cls.SUB_BUCKET_BITS
+        return (shift << (cls.SUB_BUCKET_BITS - 1)) + (micros >> shift)
+
+    @classmethod
+    def _highest_value(cls, index: int) -> int:
+        """Largest microsecond value that falls into bucket `index`"""
+        if index < (1 << cls.SUB_BUCKET_BITS):
+            return index
+        shift = index // cls.HALF - 1
+        return ((index - shift * cls.HALF + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        micros = max(int(round(seconds * 1_000_000)), 0)
+        index = self._index(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.total_squares += seconds * seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, pct: float) -> float:
+        """Latency in seconds at or below which `pct` percent of recorded values fall"""
+        if not self.count:
+            return 0.0
+        target = max(math.ceil(pct / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index) / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": "microseconds",
+            "sub_bucket_bits": self.SUB_BUCKET_BITS,
+            "count": self.count,
+            "total": self.total,
+            "total_squares": self.total_squares,
+            "min": self.min,
+            "max": self.max,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        if data.get("sub_bucket_bits", cls.SUB_BUCKET_BITS) != cls.SUB_BUCKET_BITS:
+            raise ValueError(f"histogram uses {data['sub_bucket_bits']} sub-bucket bits, "
+                             f"expected {cls.SUB_BUCKET_BITS}")
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.total_squares = data["total_squares"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_squares - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+REPORTED_PERCENTILES = [50, 90, 95, 99, 99.9]
+
+
+def latency_histogram(values) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def time_series(results: list, interval: float = 1.0) -> list:
+    """Per-interval throughput, error rate and latency, bucketed by when each request completed."""
+    if not results:
+        return []
+    start = min(r["sent_at"] for r in results)
+    buckets = {}
+    for r in results:
+        second = int((r["sent_at"] + r["elapsed"] - start) // interval)
+        bucket = buckets.setdefault(second, {"completed": 0, "errors": 0, "latency": LatencyHistogram()})
+        bucket["completed"] += 1
+        if r["success"]:
+            bucket["latency"].record(r["elapsed"])
+        else:
+            bucket["errors"] += 1
+
+    rows = []
+    for second in range(max(buckets) + 1):
+        bucket = buckets.get(second, {"completed": 0, "errors": 0, "latency": LatencyHistogram()})
+        latency = bucket["latency"]
+        rows.append({
+            "second": round(second * interval, 3),
+            "completed": bucket["completed"],
+            "throughput": round((bucket["completed"] - bucket["errors"]) / interval, 3),
+            "errors": bucket["errors"],
+            "error_rate": round(bucket["errors"] / bucket["completed"], 4) if bucket["completed"] else 0.0,
+            "p50": round(latency.percentile(50), 6),
+            "p99": round(latency.percentile(99), 6),
+            "max": round(latency.max or 0.0, 6),
+        })
+    return rows
+
+
+def write_time_series(path: str, rows: list, histogram: LatencyHistogram):
+    """Write the time series as CSV, or as JSON with overall percentiles when the path ends in .json"""
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({
+                "interval_seconds": 1,
+                "percentiles": {f"p{pct:g}": round(histogram.percentile(pct), 6) for pct in REPORTED_PERCENTILES},
+                "series": rows,
+            }, f, indent=2)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ["second"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def git_sha() -> str:
+    """Commit being tested: GIT_SHA if set (e.g. in CI images without .git), else git rev-parse HEAD"""
+    if os.getenv("GIT_SHA"):
+        return os.getenv("GIT_SHA")
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def error_counts(results: list) -> dict:
+    """Failed requests grouped by error message or HTTP status"""
+    errors = {}
+    for r in results:
+        if not r["success"]:
+            key = r["error"] or f"HTTP {r['status_code']}"
+            errors[key] = errors.get(key, 0) + 1
+    return dict(sorted(errors.items(), key=lambda item: -item[1]))
+
+
+def save_results(path: str, args, mode: str, results: list, total_time: float):
+    """Write a run's configuration, summary, latency histogram, errors and time series as JSON."""
+    successful = [r for r in results if r["success"]]
+    histogram = latency_histogram(r["elapsed"] for r in successful)
+    config = {key: value for key, value in vars(args).items()
+              if key not in ("save", "timeseries", "verbose", "debug", "quiet")}
+    with open(path, "w") as f:
+        json.dump({
+            "version": RESULTS_FORMAT_VERSION,
+            "label": args.label,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_sha": git_sha(),
+            "mode": mode,
+            "config": config,
+            "summary": {
+                "requests": len(results),
+                "successful": len(successful),
+                "failed": len(results) - len(successful),
+                "total_time": round(total_time, 3),
+                "throughput": round(len(successful) / total_time, 3) if total_time else 0.0,
+                "mean": round(histogram.mean, 6),
+                "stdev": round(histogram.stdev, 6),
+                "percentiles": {f"p{pct:g}": round(histogram.percentile(pct), 6)
+                                for pct in REPORTED_PERCENTILES},
+                "by_name": summary_by_name(results),
+            },
+            "histogram": histogram.to_dict(),
+            "errors": error_counts(results),
+            "timeseries": time_series(results),
+        }, f, indent=2)
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        run = json.load(f)
+    if run.get("version") != RESULTS_FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported results format version {run.get('version')}")
+    run["histogram"] = LatencyHistogram.from_dict(run["histogram"])
+    return run
+
+
+def normal_two_sided_p(z: float) -> float:
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz's method)"""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 1000):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-14:
+            break
+    return result
+
+
+def regularized_beta(a: float, b: float, x: float) -> float:
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1 - x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - front * _beta_continued_fraction(b, a, 1 - x) / b
+
+
+def student_t_two_sided_p(t: float, df: float) -> float:
+    return regularized_beta(df / 2, 0.5, df / (df + t * t))
+
+
+def binomial_tail(n: int, p: float, k: int) -> float:
+    """P(X >= k) for X ~ Binomial(n, p)"""
+    if k <= 0 or p >= 1:
+        return 1.0
+    if k > n or p <= 0:
+        return 0.0
+    variance = n * p * (1 - p)
+    if variance > 100:
+        # Normal approximation with continuity correction; the exact form converges slowly here
+        return 0.5 * math.erfc((k - 0.5 - n * p) / math.sqrt(2 * variance))
+    return regularized_beta(k, n - k + 1, p)
+
+
+def percentile_distribution(histogram: LatencyHistogram, pct: float) -> list:
+    """Exact bootstrap distribution of a percentile, as (bucket index, probability) pairs.
+
+    The percentile of a resample of the same size is its k-th smallest value, which lies at or
+    below bucket x when at least k of the n draws do: P(Binomial(n, F(x)) >= k).
+    """
+    n = histogram.count
+    k = max(math.ceil(pct / 100 * n), 1)
+    distribution = []
+    seen = 0
+    below = 0.0
+    for index in sorted(histogram.counts):
+        seen += histogram.counts[index]
+        at_or_below = binomial_tail(n, seen / n, k) if seen < n else 1.0
+        if at_or_below > below:
+            distribution.append((index, at_or_below - below))
+            below = at_or_below
+        if below >= 1.0:
+            break
+    return distribution
+
+
+def percentile_test(baseline: LatencyHistogram, current: LatencyHistogram, pct: float) -> tuple:
+    """One-sided bootstrap tests of a percentile; returns (p that it got slower, p that it got faster).
+
+    Each p-value is the probability, over resamples of both runs, that the current percentile
+    is not on the tested side of the baseline one.
+    """
+    if not baseline.count or not current.count:
+        return 1.0, 1.0
+    base = percentile_distribution(baseline, pct)
+    cur = percentile_distribution(current, pct)
+    p_slower = p_faster = 0.0
+    i = 0
+    cur_below = 0.0  # P(current < bucket), accumulated as the baseline buckets ascend
+    for index, probability in base:
+        while i < len(cur) and cur[i][0] < index:
+            cur_below += cur[i][1]
+            i += 1
+        cur_at = cur[i][1] if i < len(cur) and cur[i][0] == index else 0.0
+        p_slower += probability * (cur_below + cur_at)
+        p_faster += probability * (1.0 - cur_below)
+    return min(p_slower, 1.0), min(p_faster, 1.0)
+
+
+def one_sided(statistic: float, two_sided_p: float) -> tuple:
+    """Split a symmetric two-sided p-value into (p for an increase, p for a decrease)"""
+    half = two_sided_p / 2
+    if statistic > 0:
+        return half, 1.0 - half
+    if statistic < 0:
+        return 1.0 - half, half
+    return 1.0 - half, 1.0 - half
+
+
+def welch_t_test(baseline: list, current: list) -> tuple:
+    """Welch's t-test for a difference in means; returns (t, two-sided p)."""
+    n1, n2 = len(baseline), len(current)
+    if n1 < 2 or n2 < 2:
+        return 0.0, 1.0
+    mean1, mean2 = sum(baseline) / n1, sum(current) / n2
+    var1 = sum((x - mean1) ** 2 for x in baseline) / (n1 - 1) / n1
+    var2 = sum((x - mean2) ** 2 for x in current) / (n2 - 1) / n2
+    if var1 + var2 == 0:
+        return 0.0, 1.0 if mean1 == mean2 else 0.0
+    t = (mean2 - mean1) / math.sqrt(var1 + var2)
+    df = (var1 + var2) ** 2 / (var1 ** 2 / (n1 - 1) + var2 ** 2 / (n2 - 1))
+    return t, student_t_two_sided_p(t, df)
+
+
+def two_proportion_z_test(errors1: int, n1: int, errors2: int, n2: int) -> tuple:
+    """z-test for a difference between two error rates; returns (z, two-sided p)."""
+    if not n1 or not n2:
+        return 0.0, 1.0
+    pooled = (errors1 + errors2) / (n1 + n2)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    if se == 0:
+        return 0.0, 1.0
+    z = (errors2 / n2 - errors1 / n1) / se
+    return z, normal_two_sided_p(z)
+
+
+def steady_throughput(run: dict) -> list:
+    """Per-second throughput without the partial first and last seconds"""
+    series = [row["throughput"] for row in run["timeseries"]]
+    return series[1:-1] if len(series) > 3 else series
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float, error_threshold: float,
+                 alpha: float) -> list:
+    """Compare two saved runs; returns one row per metric with its change, p-value and verdict.
+
+    Every metric gets its own one-sided tests, one per direction. A metric is a regression only
+    when it got worse by more than the threshold and the test for getting worse is significant
+    at `alpha`, so noise between identical runs does not fail a build.
+    """
+    rows = []
+
+    def add(metric, base, cur, change, p_worse, p_better, worse, better, unit):
+        if worse and p_worse < alpha:
+            verdict = "REGRESSION"
+        elif better and p_better < alpha:
+            verdict = "improved"
+        elif worse or better:
+            verdict = "not significant"
+        else:
+            verdict = "ok"
+        rows.append({"metric": metric, "baseline": base, "current": cur, "change": change, "unit": unit,
+                     "p_value": p_better if better else p_worse, "verdict": verdict})
+
+    # Latency: each percentile is tested on its own, so tail and bulk can move apart
+    base_latency, cur_latency = baseline["histogram"], current["histogram"]
+    for pct in REPORTED_PERCENTILES:
+        base, cur = base_latency.percentile(pct), cur_latency.percentile(pct)
+        change = (cur - base) / base * 100 if base else 0.0
+        p_slower, p_faster = percentile_test(base_latency, cur_latency, pct)
+        add(f"p{pct:g} latency", base, cur, change, p_slower, p_faster,
+            change > threshold, change < -threshold, "s")
+
+    # Throughput: per-second samples, or just the totals when there is no time series
+    base_series, cur_series = steady_throughput(baseline), steady_throughput(current)
+    p_higher, p_lower = one_sided(*welch_t_test(base_series, cur_series))
+    base, cur = baseline["summary"]["throughput"], current["summary"]["throughput"]
+    change = (cur - base) / base * 100 if base else 0.0
+    add("throughput", base, cur, change, p_lower, p_higher, change < -threshold, change > threshold, "req/s")
+
+    # Error rate: compared in percentage points
+    base_summary, cur_summary = baseline["summary"], current["summary"]
+    p_higher, p_lower = one_sided(*two_proportion_z_test(base_summary["failed"], base_summary["requests"],
+                                                         cur_summary["failed"], cur_summary["requests"]))
+    base = base_summary["failed"] / base_summary["requests"] * 100 if base_summary["requests"] else 0.0
+    cur = cur_summary["failed"] / cur_summary["requests"] * 100 if cur_summary["requests"] else 0.0
+    add("error rate", base, cur, cur - base, p_higher, p_lower,
+        cur - base > error_threshold, cur - base < -error_threshold, "%")
+    return rows
+
+
+def describe_run(run: dict) -> str:
+    sha = (run.get("git_sha") or "unknown")[:12]
+    label = f"{run['label']}, " if run.get("label") else ""
+    return (f"{label}{run['mode']}, {run['summary']['requests']} requests, "
+            f"commit {sha}, {run['created_at']}")
+
+
+def compare_main(argv: list) -> int:
+    parser = argparse.ArgumentParser(
+        prog="load_test.py compare",
+        description="Compare two runs saved with --save and fail on significant regressions")
+    parser.add_argument("baseline", help="Results file of the reference run")
+    parser.add_argument("current", help="Results file of the run being checked")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percent change in a latency percentile or throughput that counts as a regression (default: 10)"
+    )
+    parser.add_argument(
+        "--error-threshold",
+        type=float,
+        default=1.0,
+        help="Increase in error rate, in percentage points, that counts as a regression (default: 1)"
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Significance level a change must reach to count (default: 0.05)"
+    )
+    args = parser.parse_args(argv)
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    rows = compare_runs(baseline, current, args.threshold, args.error_threshold, args.alpha)
+
+    print("=" * 80)
+    print("LOAD TEST COMPARISON")
+    print("=" * 80)
+    print(f"Baseline:  {describe_run(baseline)}")
+    print(f"Current:   {describe_run(current)}")
+    print(f"Threshold: {args.threshold:g}% latency/throughput, {args.error_threshold:g} points error rate, "
+          f"alpha {args.alpha:g}")
+    print("-" * 80)
+    print(f"{'metric':<16}{'baseline':>12}{'current':>12}{'change':>10}{'p-value':>10}  verdict")
+    print("-" * 80)
+    for row in rows:
+        if row["unit"] == "s":
+            values = f"{row['baseline'] * 1000:>10.1f}ms{row['current'] * 1000:>10.1f}ms"
+        else:
+            values = f"{row['baseline']:>12.2f}{row['current']:>12.2f}"
+        change = f"{row['change']:+.1f}" + ("pt" if row["unit"] == "%" else "%")
+        print(f"{row['metric']:<16}{values}{change:>10}{row['p_value']:>10.3g}  {row['verdict']}")
+
+    regressions = [row["metric"] for row in rows if row["verdict"] == "REGRESSION"]
+    print("-" * 80)
+    if regressions:
+        print(f"FAIL: significant regression in {', '.join(regressions)}")
+        return 1
+    print("PASS: no significant regression")
+    return 0
+
+
+def summary_by_name(results: list) -> dict:
+    """Requests, failures and latency percentiles per scenario request name"""
+    by_name = {}
+    for r in results:
+        if r.get("name"):
+            by_name.setdefault(r["name"], []).append(r)
+    summary = {}
+    for name, rows in sorted(by_name.items()):
+        histogram = latency_histogram(r["elapsed"] for r in rows if r["success"])
+        summary[name] = {
+            "requests": len(rows),
+            "failed": sum(1 for r in rows if not r["success"]),
+            "p50": round(histogram.percentile(50), 6),
+            "p95": round(histogram.percentile(95), 6),
+            "p99": round(histogram.percentile(99), 6),
+        }
+    return summary
+
+
+def print_percentiles(histogram: LatencyHistogram):
+    for pct in REPORTED_PERCENTILES:
+        label = f"p{pct:g}:"
+        print(f"  {label:<18}{histogram.percentile(pct):.3f}s")
+
+
 def print_summary(results: list, total_time: float):
     """Print test summary statistics."""
     print("\n" + "=" * 60)
@@ -127,15 +1091,34 @@ def print_summary(results: list, total_time: float):
     print(f"Total time:         {total_time:.2f}s")
 
     if successful:
-        times = [r["elapsed"] for r in successful]
+        histogram = latency_histogram(r["elapsed"] for r in successful)
         print(f"\nResponse times (successful requests):")
-        print(f"  Min:              {min(times):.2f}s")
-        print(f"  Max:              {max(times):.2f}s")
-        print(f"  Average:          {statistics.mean(times):.2f}s")
-        if len(times) > 1:
-            print(f"  Std Dev:          {statistics.stdev(times):.2f}s")
+        print(f"  Min:              {histogram.min:.2f}s")
+        print(f"  Max:              {histogram.max:.2f}s")
+        print(f"  Average:          {histogram.mean:.2f}s")
+        if histogram.count > 1:
+            print(f"  Std Dev:          {histogram.stdev:.2f}s")
+        print_percentiles(histogram)
         print(f"  Requests/sec:     {len(successful) / total_time:.2f}")
 
+        # Open-loop runs: elapsed counts from the scheduled send, service time from the actual one
+        lags = [r["start_lag"] for r in successful]
+        if max(lags) > 0.01:
+            service_times = latency_histogram(r["service_time"] for r in successful)
+            print(f"\nService time (from actual send):")
+            print(f"  Average:          {service_times.mean:.2f}s")
+            print(f"  Max:              {service_times.max:.2f}s")
+            print_percentiles(service_times)
+            print(f"  Max send delay:   {max(lags):.2f}s (waited for --max-in-flight or the client fell behind)")
+
+    by_name = summary_by_name(results)
+    if by_name:
+        print(f"\nBy request (successful latencies):")
+        print(f"  {'name':<22}{'requests':>9}{'failed':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for name, row in by_name.items():
+            print(f"  {name[:21]:<22}{row['requests']:>9}{row['failed']:>8}"
+                  f"{row['p50']:>8.3f}s{row['p95']:>8.3f}s{row['p99']:>8.3f}s")
+
     if failed:
         print(f"\nFailed requests:")
         for r in failed:
@@ -145,6 +1128,9 @@ def print_summary(results: list, total_time: float):
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        return compare_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(description="Load test the FastAPI LangGraph API")
     parser.add_argument(
         "--url",
@@ -168,6 +1154,74 @@ def main():
         action="store_true",
         help="Run requests sequentially instead of concurrently"
     )
+    parser.add_argument(
+        "--rate", "-r",
+        type=float,
+        help="Open-loop mode: send this many requests per second instead of using fixed workers"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION,
+        help=f"Open-loop test length in seconds (default: {DEFAULT_DURATION})"
+    )
+    parser.add_argument(
+        "--arrival",
+        choices=["poisson", "constant"],
+        default="poisson",
+        help="Open-loop spacing between requests (default: poisson)"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Open-loop cap on requests in progress; later sends wait and count as latency "
+             f"(default: {DEFAULT_MAX_IN_FLIGHT})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for Poisson arrivals"
+    )
+    parser.add_argument(
+        "--scenario",
+        metavar="FILE",
+        help="Run the weighted flows, think times and stages in a YAML or JSON scenario file "
+             "instead of the built-in /question queries (uses the async engine)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default="threads",
+        help="threads: one thread per concurrent request; async: one event loop with pooled "
+             "connections, for thousands of users (default: threads)"
+    )
+    parser.add_argument(
+        "--processes", "-p",
+        type=int,
+        default=1,
+        help="Async engine: split the load over this many processes (default: 1)"
+    )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Do not print a line per request"
+    )
+    parser.add_argument(
+        "--timeseries",
+        metavar="FILE",
+        help="Write per-second throughput, error rate and latency to FILE (.csv, or .json)"
+    )
+    parser.add_argument(
+        "--save",
+        metavar="FILE",
+        help="Save config, git commit, latency histogram, errors and time series as JSON "
+             "for `load_test.py compare`"
+    )
+    parser.add_argument(
+        "--label",
+        help="Free-form description stored with --save, e.g. the model or image under test"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -189,37 +1243,103 @@ def main():
     # Build query list based on iterations
     all_queries = QUERIES * args.iterations
 
+    scenario = None
+    if args.scenario:
+        if args.rate or args.sequential:
+            parser.error("--scenario sets its own load with stages; drop --rate and --sequential")
+        scenario = load_scenario(args.scenario)
+        if not scenario["stages"]:
+            scenario["stages"] = [{"duration": args.duration, "users": args.concurrent}]
+        args.engine = "async"
+
+    if args.processes > 1:
+        args.engine = "async"
+    if args.engine == "async" and args.sequential:
+        args.concurrent = 1
+    if args.processes > 1 and not (args.rate or scenario):
+        # Closed loop: a process without users would drop its share of the queries
+        usable = max(min(args.concurrent, len(all_queries)), 1)
+        if args.processes > usable:
+            logger.warning("Only %s concurrent requests to split; using %s processes instead of %s",
+                           usable, usable, args.processes)
+            args.processes = usable
+
+    if scenario:
+        mode = (f"Scenario {scenario['name']} (up to {max(stage['users'] for stage in scenario['stages'])} "
+                f"users for {sum(stage['duration'] for stage in scenario['stages']):g}s)")
+    elif args.rate:
+        mode = f"Open loop ({args.rate:g} req/s {args.arrival} for {args.duration:g}s)"
+    elif args.sequential:
+        mode = "Sequential"
+    else:
+        mode = f"Concurrent ({args.concurrent} workers)"
+
     print("=" * 60)
     print("LOAD TEST - FastAPI LangGraph API")
     print("=" * 60)
     print(f"SERVICE_URL env:    {SERVICE_URL}")
     print(f"Target URL:         {args.url}")
-    print(f"Total queries:      {len(all_queries)}")
-    print(f"Iterations:         {args.iterations}")
-    print(f"Mode:               {'Sequential' if args.sequential else f'Concurrent ({args.concurrent} workers)'}")
+    if scenario:
+        total_weight = sum(flow["weight"] for flow in scenario["flows"])
+        print("Flows:              " + ", ".join(
+            f"{flow['name']} {flow['weight'] / total_weight:.0%}" for flow in scenario["flows"]))
+        print("Stages:             " + ", ".join(
+            f"{stage['duration']:g}s to {stage['users']} users" for stage in scenario["stages"]))
+    elif args.rate:
+        print(f"Planned requests:   ~{int(args.rate * args.duration)}")
+    else:
+        print(f"Total queries:      {len(all_queries)}")
+        print(f"Iterations:         {args.iterations}")
+    print(f"Mode:               {mode}")
+    print(f"Engine:             {args.engine}" + (f" x {args.processes} processes" if args.processes > 1 else ""))
     print("=" * 60)
     print()
 
     # Check if server is reachable
     print("Checking server connectivity...")
-    try:
-        response = requests.get(f"{args.url}/", timeout=5)
-        print(f"Server is up! Status: {response.status_code}\n")
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Cannot connect to server at {args.url}")
-        print(f"Details: {e}")
-        return 1
+    base_urls = [args.url]
+    if scenario:
+        # Flows with weight 0 are never sent, so their services need not be up
+        base_urls += sorted({flow["url"] for flow in scenario["flows"]
+                             if flow["url"] and flow["weight"] > 0} - {args.url})
+    for base_url in base_urls:
+        try:
+            response = requests.get(f"{base_url}/", timeout=5)
+            print(f"Server is up! Status: {response.status_code}" + (f" ({base_url})" if scenario else ""))
+        except requests.exceptions.RequestException as e:
+            print(f"Error: Cannot connect to server at {base_url}")
+            print(f"Details: {e}")
+            return 1
+    print()
 
     # Run the test
     print("Starting load test...\n")
     start_time = time.time()
 
-    if args.sequential:
+    if args.processes > 1:
+        results = run_sharded_test(args, QUERIES if args.rate else all_queries, scenario)
+    elif scenario:
+        results = asyncio.run(run_scenario_test(
+            args.url, scenario, scenario["stages"], args.seed, args.verbose, args.quiet))
+    elif args.engine == "async" and args.rate:
+        results = asyncio.run(run_async_open_loop_test(
+            args.url, QUERIES, args.rate, args.duration, args.arrival, args.max_in_flight,
+            args.seed, args.verbose, args.quiet))
+    elif args.engine == "async":
+        results = asyncio.run(run_async_test(args.url, all_queries, args.concurrent, args.verbose, args.quiet))
+    elif args.rate:
+        results = run_open_loop_test(args.url, QUERIES, args.rate, args.duration,
+                                     args.arrival, args.max_in_flight, args.seed, args.quiet)
+    elif args.sequential:
         results = run_sequential_test(args.url, all_queries)
     else:
-        results = run_concurrent_test(args.url, all_queries, args.concurrent)
+        results = run_concurrent_test(args.url, all_queries, args.concurrent, args.quiet)
 
     total_time = time.time() - start_time
+    if args.processes > 1 and results:
+        # Leave out process start-up: from the first scheduled send to the last response
+        total_time = (max(r["sent_at"] + r["elapsed"] for r in results)
+                      - min(r["sent_at"] for r in results))
 
     # Show verbose output if requested
     if args.verbose:
@@ -235,6 +1355,15 @@ def main():
     # Print summary
     print_summary(results, total_time)
 
+    if args.timeseries:
+        write_time_series(args.timeseries, time_series(results),
+                          latency_histogram(r["elapsed"] for r in results if r["success"]))
+        print(f"\nTime series written to {args.timeseries}")
+
+    if args.save:
+        save_results(args.save, args, mode, results, total_time)
+        print(f"Results saved to {args.save}")
+
     return 0 if all(r["success"] for r in results) else 1
 
 
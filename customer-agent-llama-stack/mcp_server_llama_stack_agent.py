@@ -26,15 +26,26 @@ Architecture:
 │         Llama Stack Agent                   │
 │         - Calls Customer MCP Server         │
 └─────────────────────────────────────────────┘
+
+Agent calls use the async Llama Stack client, so a slow agent turn does not
+block other MCP clients. At most CUSTOMER_AGENT_MAX_CONCURRENCY calls run at
+once; further calls wait in a queue of up to CUSTOMER_AGENT_MAX_QUEUE callers
+for at most CUSTOMER_AGENT_QUEUE_TIMEOUT seconds. Queue statistics are
+available at GET /agent-stats.
 """
 
 import os
 import json
+import time
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv, find_dotenv
-from llama_stack_client import LlamaStackClient
+from llama_stack_client import AsyncLlamaStackClient
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -68,24 +79,113 @@ LLAMA_STACK_BASE_URL = os.getenv("LLAMA_STACK_BASE_URL")
 INFERENCE_MODEL = os.getenv("INFERENCE_MODEL")
 MCP_CUSTOMER_SERVER_URL = os.getenv("MCP_CUSTOMER_SERVER_URL")
 
+# Concurrency limits for agent calls
+CUSTOMER_AGENT_MAX_CONCURRENCY = int(os.getenv("CUSTOMER_AGENT_MAX_CONCURRENCY", "8"))
+CUSTOMER_AGENT_MAX_QUEUE = int(os.getenv("CUSTOMER_AGENT_MAX_QUEUE", "100"))
+CUSTOMER_AGENT_QUEUE_TIMEOUT = float(os.getenv("CUSTOMER_AGENT_QUEUE_TIMEOUT", "60"))
+
 
 # Global Llama Stack client
 llama_client = None
 
 
 def get_llama_client():
-    """Get or create Llama Stack client."""
+    """Get or create the async Llama Stack client."""
     global llama_client
     if llama_client is None:
         LLAMA_STACK_BASE_URL = os.getenv("LLAMA_STACK_BASE_URL")
         logger.info(f"Creating new Llama Stack client with base_url: {LLAMA_STACK_BASE_URL}")
-        llama_client = LlamaStackClient(base_url=LLAMA_STACK_BASE_URL)
+        llama_client = AsyncLlamaStackClient(base_url=LLAMA_STACK_BASE_URL)
         logger.info("Llama Stack client created successfully")
     return llama_client
 
 
+class AgentBusyError(Exception):
+    """Raised when an agent call cannot get a slot in time."""
+
+
+class AgentCallLimiter:
+    """Bound the number of in-flight agent calls and track queueing."""
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_in_flight = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a free agent slot, rejecting callers when the queue is full or too slow."""
+        start = time.perf_counter()
+        if not self._semaphore.locked():
+            # A slot is free, so this does not wait
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                raise AgentBusyError(f"{self.waiting} agent calls already queued")
+
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise AgentBusyError(f"no agent slot free after {self.queue_timeout}s")
+            finally:
+                self.waiting -= 1
+
+        waited = time.perf_counter() - start
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        logger.info(f"Agent slot acquired after {waited * 1000:.0f}ms "
+                    f"({self.in_flight} in flight, {self.waiting} waiting)")
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        started = self.completed + self.in_flight
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_waiting": self.peak_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_seconds": round(self.total_wait / started, 4) if started else 0.0,
+            "max_wait_seconds": round(self.max_wait, 4),
+        }
+
+
+agent_limiter = AgentCallLimiter(
+    CUSTOMER_AGENT_MAX_CONCURRENCY, CUSTOMER_AGENT_MAX_QUEUE, CUSTOMER_AGENT_QUEUE_TIMEOUT)
+
+
+@mcp.custom_route("/agent-stats", methods=["GET"])
+async def agent_stats(request: Request) -> JSONResponse:
+    """Report agent call concurrency and queueing."""
+    return JSONResponse(agent_limiter.stats())
+
+
 @mcp.tool()
-def customer_agent(prompt: str) -> str:
+async def customer_agent(prompt: str) -> str:
     """
     Execute the customer agent with the given prompt.
 
@@ -117,29 +217,33 @@ def customer_agent(prompt: str) -> str:
 
         # Use Llama Stack's Responses API with MCP tools
         logger.info("Creating Llama Stack Agent via responses.create...")
-        agent_responses = client.responses.create(
-            model=INFERENCE_MODEL,
-            input=prompt,
-            tools=[
-                {
-                    "type": "mcp",
-                    "server_url": MCP_CUSTOMER_SERVER_URL,
-                    "server_label": "customer",
-                }
-            ],
-        )
+        async with agent_limiter.slot():
+            agent_responses = await client.responses.create(
+                model=INFERENCE_MODEL,
+                input=prompt,
+                tools=[
+                    {
+                        "type": "mcp",
+                        "server_url": MCP_CUSTOMER_SERVER_URL,
+                        "server_label": "customer",
+                    }
+                ],
+            )
 
         # Return the final text response
         logger.info(f"Agent response received: {agent_responses.output_text[:100]}...")
         return agent_responses.output_text
 
+    except AgentBusyError as e:
+        logger.warning(f"Customer agent busy: {str(e)}")
+        return f"Error: customer agent is busy ({str(e)}), retry later"
     except Exception as e:
         logger.error(f"Error executing customer agent: {str(e)}", exc_info=True)
         return f"Error executing customer agent: {str(e)}"
 
 
 @mcp.tool()
-def customer_agent_detailed(prompt: str) -> str:
+async def customer_agent_detailed(prompt: str) -> str:
     """
     Execute the customer agent with detailed execution trace.
 
@@ -166,17 +270,18 @@ def customer_agent_detailed(prompt: str) -> str:
 
         # Use Llama Stack's Responses API with MCP tools
         logger.info("Calling Llama Stack responses API with detailed trace...")
-        agent_responses = client.responses.create(
-            model=INFERENCE_MODEL,
-            input=prompt,
-            tools=[
-                {
-                    "type": "mcp",
-                    "server_url": MCP_CUSTOMER_SERVER_URL,
-                    "server_label": "customer",
-                }
-            ],
-        )
+        async with agent_limiter.slot():
+            agent_responses = await client.responses.create(
+                model=INFERENCE_MODEL,
+                input=prompt,
+                tools=[
+                    {
+                        "type": "mcp",
+                        "server_url": MCP_CUSTOMER_SERVER_URL,
+                        "server_label": "customer",
+                    }
+                ],
+            )
 
         # Build detailed trace
         logger.info("Building detailed execution trace...")
@@ -217,6 +322,9 @@ def customer_agent_detailed(prompt: str) -> str:
         logger.info(f"Detailed trace completed with {len(trace)} steps")
         return json.dumps(result, indent=2)
 
+    except AgentBusyError as e:
+        logger.warning(f"Customer agent busy (detailed): {str(e)}")
+        return json.dumps({"error": f"Customer agent is busy ({str(e)}), retry later"})
     except Exception as e:
         logger.error(f"Error executing customer agent (detailed): {str(e)}", exc_info=True)
         return json.dumps({"error": f"Error executing customer agent: {str(e)}"})
@@ -234,6 +342,9 @@ if __name__ == "__main__":
     logger.info(f"  INFERENCE_MODEL: {INFERENCE_MODEL}")
     logger.info(f"  MCP_CUSTOMER_SERVER_URL: {MCP_CUSTOMER_SERVER_URL}")
     logger.info(f"  CUSTOMER_AGENT_PORT: {CUSTOMER_AGENT_PORT}")
+    logger.info(f"  CUSTOMER_AGENT_MAX_CONCURRENCY: {CUSTOMER_AGENT_MAX_CONCURRENCY}")
+    logger.info(f"  CUSTOMER_AGENT_MAX_QUEUE: {CUSTOMER_AGENT_MAX_QUEUE}")
+    logger.info(f"  CUSTOMER_AGENT_QUEUE_TIMEOUT: {CUSTOMER_AGENT_QUEUE_TIMEOUT}")
     logger.info("=" * 60)
 
     mcp.run(transport="streamable-http")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the Fantaco Customer and Finance MCP servers
+
+Calls MCP tools over streamable HTTP at a fixed concurrency and reports
+latency percentiles (p50/p95/p99) and throughput per tool.
+
+Arguments are drawn from the same synthetic dataset that fake_fantaco_api.py
+serves, so run the fake API with the same --customers and --seed values.
+
+Usage:
+    python benchmark_mcp.py --concurrency 20 --requests 2000
+    python benchmark_mcp.py --tools get_customer,fetch_order_history --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from fastmcp import Client
+
+from fake_fantaco_api import SyntheticDataset
+
+DEFAULT_CUSTOMER_MCP_URL = os.getenv("CUSTOMER_MCP_SERVER_URL", "http://localhost:9001/mcp")
+DEFAULT_FINANCE_MCP_URL = os.getenv("FINANCE_MCP_SERVER_URL", "http://localhost:9002/mcp")
+
+
+def tool_arguments(dataset: SyntheticDataset, rng: random.Random) -> Dict[str, Callable[[], Tuple[str, Dict[str, Any]]]]:
+    """Argument generators per tool, returning (server, arguments)."""
+    def customer() -> Dict[str, Any]:
+        return rng.choice(dataset.customers)
+
+    return {
+        "get_customer": lambda: ("customer", {"customer_id": customer()["customerId"]}),
+        "search_customers": lambda: ("customer", {"contact_email": customer()["contactEmail"]}),
+        "get_customers": lambda: ("customer", {
+            "customer_ids": [customer()["customerId"] for _ in range(10)]
+        }),
+        "fetch_order_history": lambda: ("finance", {"customer_id": customer()["customerId"]}),
+        "fetch_invoice_history": lambda: ("finance", {"customer_id": customer()["customerId"]}),
+        "summarize_invoice_history": lambda: ("finance", {"customer_id": customer()["customerId"]}),
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+async def worker(clients: Dict[str, Client], generators, tools: List[str], rng: random.Random,
+                 results: List[Dict[str, Any]], should_continue: Callable[[], bool]):
+    """Call randomly chosen tools back to back until should_continue() is false."""
+    while should_continue():
+        tool = rng.choice(tools)
+        server, arguments = generators[tool]()
+        start = time.perf_counter()
+        error = None
+        size = 0
+        try:
+            result = await clients[server].call_tool(tool, arguments, raise_on_error=False)
+            content = result.structured_content or {}
+            size = len(json.dumps(content))
+            if result.is_error:
+                error = "tool error"
+            elif "error" in content:
+                error = str(content.get("status_code") or content["error"])
+        except Exception as e:
+            error = type(e).__name__
+        results.append({
+            "tool": tool,
+            "elapsed": time.perf_counter() - start,
+            "error": error,
+            "bytes": size,
+        })
+
+
+async def run_benchmark(args) -> Tuple[List[Dict[str, Any]], float]:
+    dataset = SyntheticDataset(args.customers, 0, args.seed)
+    rng = random.Random(args.seed)
+    generators = tool_arguments(dataset, rng)
+    tools = [tool.strip() for tool in args.tools.split(",") if tool.strip()]
+    unknown = [tool for tool in tools if tool not in generators]
+    if unknown:
+        raise SystemExit(f"Unknown tools: {', '.join(unknown)}")
+
+    results: List[Dict[str, Any]] = []
+    issued = 0
+    deadline = None
+
+    def should_continue() -> bool:
+        nonlocal issued
+        if deadline is not None:
+            return time.perf_counter() < deadline
+        if issued >= args.requests:
+            return False
+        issued += 1
+        return True
+
+    # One MCP session per virtual user and server, like independent agent sessions
+    sessions = []
+    for _ in range(args.concurrency):
+        sessions.append({
+            "customer": Client(args.customer_url, timeout=args.timeout),
+            "finance": Client(args.finance_url, timeout=args.timeout),
+        })
+    needed = {generators[tool]()[0] for tool in tools}
+    for clients in sessions:
+        for server in needed:
+            await clients[server].__aenter__()
+
+    try:
+        if args.warmup:
+            warmup_results: List[Dict[str, Any]] = []
+            remaining = args.warmup
+
+            def warmup_continue() -> bool:
+                nonlocal remaining
+                remaining -= 1
+                return remaining >= 0
+
+            await asyncio.gather(*(
+                worker(clients, generators, tools, random.Random(rng.random()), warmup_results, warmup_continue)
+                for clients in sessions
+            ))
+
+        if args.duration:
+            deadline = time.perf_counter() + args.duration
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            worker(clients, generators, tools, random.Random(rng.random()), results, should_continue)
+            for clients in sessions
+        ))
+        total_time = time.perf_counter() - start
+    finally:
+        for clients in sessions:
+            for server in needed:
+                await clients[server].__aexit__(None, None, None)
+
+    return results, total_time
+
+
+def print_report(results: List[Dict[str, Any]], total_time: float, args):
+    print("\n" + "=" * 96)
+    print(f"MCP BENCHMARK - concurrency {args.concurrency}, {len(results)} calls in {total_time:.2f}s")
+    print("=" * 96)
+    print(f"{'tool':<28}{'calls':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'mean ms':>10}{'req/s':>9}{'avg KB':>9}")
+    print("-" * 96)
+
+    by_tool: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        by_tool.setdefault(result["tool"], []).append(result)
+    for tool, rows in sorted(by_tool.items()) + [("ALL", results)]:
+        if not rows:
+            continue
+        latencies = [row["elapsed"] * 1000 for row in rows]
+        errors = sum(1 for row in rows if row["error"])
+        print(f"{tool:<28}{len(rows):>7}{errors:>8}"
+              f"{percentile(latencies, 50):>10.1f}{percentile(latencies, 95):>10.1f}"
+              f"{percentile(latencies, 99):>10.1f}{statistics.mean(latencies):>10.1f}"
+              f"{len(rows) / total_time:>9.1f}{statistics.mean(row['bytes'] for row in rows) / 1024:>9.1f}")
+
+    errors: Dict[str, int] = {}
+    for result in results:
+        if result["error"]:
+            key = f"{result['tool']}: {result['error']}"
+            errors[key] = errors.get(key, 0) + 1
+    if errors:
+        print("\nErrors:")
+        for key, count in sorted(errors.items(), key=lambda item: -item[1]):
+            print(f"  {count:>6}  {key}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Fantaco MCP servers")
+    parser.add_argument("--customer-url", default=DEFAULT_CUSTOMER_MCP_URL,
+                        help=f"Customer MCP server URL (default: {DEFAULT_CUSTOMER_MCP_URL})")
+    parser.add_argument("--finance-url", default=DEFAULT_FINANCE_MCP_URL,
+                        help=f"Finance MCP server URL (default: {DEFAULT_FINANCE_MCP_URL})")
+    parser.add_argument("--tools", default="get_customer,search_customers,fetch_order_history,fetch_invoice_history",
+                        help="Comma-separated tools to call, chosen uniformly at random")
+    parser.add_argument("--concurrency", "-c", type=int, default=10, help="Concurrent MCP sessions (default: 10)")
+    parser.add_argument("--requests", "-n", type=int, default=1000, help="Total tool calls (default: 1000)")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="Run for this many seconds instead of a fixed number of calls")
+    parser.add_argument("--warmup", type=int, default=0, help="Untimed calls before measuring (default: 0)")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-call timeout in seconds (default: 60)")
+    parser.add_argument("--customers", type=int, default=1000,
+                        help="Customers in the fake API dataset, must match fake_fantaco_api.py (default: 1000)")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset seed, must match fake_fantaco_api.py")
+    args = parser.parse_args()
+
+    results, total_time = asyncio.run(run_benchmark(args))
+    print_report(results, total_time, args)
+    return 0 if all(not result["error"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
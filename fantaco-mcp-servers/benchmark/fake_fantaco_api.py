@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Fantaco Customer and Finance APIs
+
+Serves the endpoints the MCP servers call, backed by a synthetic dataset,
+so the MCP servers can be benchmarked on a laptop or in CI without the
+Spring Boot applications and their PostgreSQL databases.
+
+Endpoints:
+    GET  /api/customers                   Search customers (companyName, contactName, contactEmail, phone)
+    GET  /api/customers/{customerId}      Get a customer by ID
+    POST /api/finance/orders/history      Order history for a customer
+    POST /api/finance/invoices/history    Invoice history for a customer
+
+Dataset:
+    Customers are generated up front. Orders and invoices are generated on demand
+    from a per-customer seed, so the same request always returns the same rows and
+    millions of history rows do not need to be held in memory.
+    The demo customers used in the workshop (Thomas Hardy, Liu Wong, Fran Wilson)
+    are always present.
+
+Usage:
+    python fake_fantaco_api.py --customers 10000 --orders-per-customer 200 --latency-ms 20 --error-rate 0.01
+
+    Point both MCP servers at it:
+    CUSTOMER_API_BASE_URL=http://localhost:8090
+    FINANCE_API_BASE_URL=http://localhost:8090
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+logger = logging.getLogger(__name__)
+
+# Demo customers referenced throughout the workshop
+DEMO_CUSTOMERS = [
+    ("AROUT", "Around the Horn", "Thomas Hardy", "thomashardy@example.com", "London", "UK"),
+    ("THECR", "The Cracker Box", "Liu Wong", "liuwong@example.com", "Butte", "USA"),
+    ("LONEP", "Lonesome Pine Restaurant", "Fran Wilson", "franwilson@example.com", "Portland", "USA"),
+]
+
+FIRST_NAMES = ["Ana", "Ben", "Carla", "Dev", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jonas",
+               "Kara", "Luis", "Mei", "Nora", "Omar", "Priya", "Quinn", "Rosa", "Sven", "Tara"]
+LAST_NAMES = ["Adams", "Baker", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Huang", "Ito", "Jensen",
+              "Khan", "Lopez", "Moreau", "Novak", "Okafor", "Patel", "Rossi", "Silva", "Tanaka", "Weber"]
+COMPANY_WORDS = ["Alpine", "Harbor", "Golden", "Prairie", "Summit", "Coastal", "Urban", "Cedar",
+                 "Maple", "Pioneer", "Silver", "River"]
+COMPANY_KINDS = ["Foods", "Traders", "Market", "Deli", "Imports", "Grocers", "Bistro", "Supply"]
+CITIES = [("London", "UK"), ("Paris", "France"), ("Berlin", "Germany"), ("Madrid", "Spain"),
+          ("Seattle", "USA"), ("Toronto", "Canada"), ("Sao Paulo", "Brazil"), ("Tokyo", "Japan")]
+ORDER_STATUSES = ["PENDING", "CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED", "REFUNDED"]
+ORDER_STATUS_WEIGHTS = [5, 10, 15, 60, 7, 3]
+INVOICE_STATUS_FOR_ORDER = {
+    "PENDING": "DRAFT",
+    "CONFIRMED": "SENT",
+    "SHIPPED": "SENT",
+    "DELIVERED": "PAID",
+    "CANCELLED": "CANCELLED",
+    "REFUNDED": "REFUNDED",
+}
+
+
+def customer_id_for(index: int) -> str:
+    """Map an index to a unique 5-letter customer ID (AAAAA, AAAAB, ...)."""
+    letters = []
+    for _ in range(5):
+        index, remainder = divmod(index, 26)
+        letters.append(chr(ord("A") + remainder))
+    return "".join(reversed(letters))
+
+
+def customer_seed(customer_id: str, seed: int) -> int:
+    """Stable per-customer seed, independent of PYTHONHASHSEED."""
+    return zlib.crc32(customer_id.encode()) ^ seed
+
+
+class SyntheticDataset:
+    """Deterministic synthetic customers, orders and invoices."""
+
+    def __init__(self, customers: int = 1000, orders_per_customer: int = 50, seed: int = 42):
+        self.orders_per_customer = orders_per_customer
+        self.seed = seed
+        self.now = datetime(2025, 12, 1)
+        self.customers: List[Dict[str, Any]] = []
+        self.customers_by_id: Dict[str, Dict[str, Any]] = {}
+
+        rng = random.Random(seed)
+        for customer_id, company, contact, email, city, country in DEMO_CUSTOMERS:
+            self._add_customer(customer_id, company, contact, email, city, country, rng)
+
+        index = 0
+        while len(self.customers) < customers:
+            customer_id = customer_id_for(index)
+            index += 1
+            if customer_id in self.customers_by_id:
+                continue
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} {customer_id}"
+            email = f"{first}.{last}.{customer_id}@example.com".lower()
+            city, country = rng.choice(CITIES)
+            self._add_customer(customer_id, company, f"{first} {last}", email, city, country, rng)
+
+    def _add_customer(self, customer_id, company, contact, email, city, country, rng):
+        created = self.now - timedelta(days=rng.randint(400, 2000))
+        customer = {
+            "customerId": customer_id,
+            "companyName": company,
+            "contactName": contact,
+            "contactTitle": rng.choice(["Owner", "Sales Manager", "Purchasing Agent", "Accountant"]),
+            "address": f"{rng.randint(1, 999)} Main Street",
+            "city": city,
+            "region": None,
+            "postalCode": f"{rng.randint(10000, 99999)}",
+            "country": country,
+            "phone": f"555-{rng.randint(1000, 9999)}",
+            "fax": f"555-{rng.randint(1000, 9999)}",
+            "contactEmail": email,
+            "createdAt": created.isoformat(),
+            "updatedAt": created.isoformat(),
+        }
+        self.customers.append(customer)
+        self.customers_by_id[customer_id] = customer
+
+    def search(self, company_name=None, contact_name=None, contact_email=None, phone=None) -> List[Dict[str, Any]]:
+        """Partial matching on the first non-blank filter, in the Customer API's order.
+
+        Like CustomerService.searchCustomers, companyName wins over contactName, then contactEmail,
+        then phone; the other filters are ignored. Name and email match case-insensitively.
+        """
+        for key, value in (("companyName", company_name), ("contactName", contact_name),
+                           ("contactEmail", contact_email), ("phone", phone)):
+            if value and value.strip():
+                if key == "phone":
+                    return [customer for customer in self.customers if value in (customer[key] or "")]
+                value = value.lower()
+                return [customer for customer in self.customers if value in (customer[key] or "").lower()]
+        return list(self.customers)
+
+    def orders(self, customer_id: str) -> List[Dict[str, Any]]:
+        """All orders for a customer, newest first."""
+        rng = random.Random(customer_seed(customer_id, self.seed))
+        count = rng.randint(self.orders_per_customer // 2, self.orders_per_customer * 3 // 2)
+        base_id = customer_seed(customer_id, 0) % 1_000_000 * 10_000
+        orders = []
+        for n in range(count):
+            order_date = self.now - timedelta(minutes=rng.randint(0, 730 * 24 * 60))
+            orders.append({
+                "id": base_id + n,
+                "orderNumber": f"ORD-{customer_id}-{n:05d}",
+                "customerId": customer_id,
+                "totalAmount": round(rng.uniform(10, 2500), 2),
+                "status": rng.choices(ORDER_STATUSES, ORDER_STATUS_WEIGHTS)[0],
+                "orderDate": order_date.replace(microsecond=0).isoformat(),
+                "createdAt": order_date.replace(microsecond=0).isoformat(),
+                "updatedAt": order_date.replace(microsecond=0).isoformat(),
+            })
+        orders.sort(key=lambda order: order["orderDate"], reverse=True)
+        return orders
+
+    def invoices(self, customer_id: str) -> List[Dict[str, Any]]:
+        """One invoice per order, newest first."""
+        rng = random.Random(customer_seed(customer_id, self.seed + 1))
+        invoices = []
+        for order in self.orders(customer_id):
+            invoice_date = datetime.fromisoformat(order["orderDate"]) + timedelta(days=1)
+            due_date = invoice_date + timedelta(days=30)
+            status = INVOICE_STATUS_FOR_ORDER[order["status"]]
+            if status == "SENT" and due_date < self.now:
+                status = "OVERDUE"
+            paid_date = invoice_date + timedelta(days=rng.randint(1, 40)) if status == "PAID" else None
+            invoices.append({
+                "id": order["id"],
+                "invoiceNumber": f"INV-{order['orderNumber'][4:]}",
+                "orderId": order["id"],
+                "customerId": customer_id,
+                "amount": order["totalAmount"],
+                "status": status,
+                "invoiceDate": invoice_date.isoformat(),
+                "dueDate": due_date.isoformat(),
+                "paidDate": paid_date.isoformat() if paid_date else None,
+                "createdAt": invoice_date.isoformat(),
+                "updatedAt": invoice_date.isoformat(),
+            })
+        return invoices
+
+
+def filter_history(rows: List[Dict[str, Any]], date_key: str, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Apply the Finance API's history semantics: date range, start date only, or limit."""
+    start_date: Optional[str] = body.get("startDate")
+    end_date: Optional[str] = body.get("endDate")
+    if start_date and end_date:
+        return [row for row in rows if start_date <= row[date_key] <= end_date]
+    if start_date:
+        return [row for row in rows if row[date_key] >= start_date]
+    return rows[:int(body.get("limit") or 50)]
+
+
+def create_app(dataset: SyntheticDataset, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+               error_rate: float = 0.0) -> Starlette:
+    """Build the fake API with injected latency and error rate."""
+    rng = random.Random(dataset.seed)
+
+    async def inject() -> Optional[JSONResponse]:
+        delay = max(rng.gauss(latency_ms, jitter_ms), 0.0) / 1000 if latency_ms or jitter_ms else 0.0
+        if delay:
+            await asyncio.sleep(delay)
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse(
+                {"success": False, "message": "Injected failure", "data": None},
+                status_code=500
+            )
+        return None
+
+    async def search_customers(request: Request) -> JSONResponse:
+        error = await inject()
+        if error:
+            return error
+        params = request.query_params
+        return JSONResponse(dataset.search(
+            company_name=params.get("companyName"),
+            contact_name=params.get("contactName"),
+            contact_email=params.get("contactEmail"),
+            phone=params.get("phone"),
+        ))
+
+    async def get_customer(request: Request) -> JSONResponse:
+        error = await inject()
+        if error:
+            return error
+        customer_id = request.path_params["customer_id"]
+        customer = dataset.customers_by_id.get(customer_id)
+        if customer is None:
+            return JSONResponse(
+                {"status": 404, "error": "Not Found", "message": f"Customer not found with ID: {customer_id}"},
+                status_code=404
+            )
+        return JSONResponse(customer)
+
+    async def history(request: Request, kind: str) -> JSONResponse:
+        error = await inject()
+        if error:
+            return error
+        body = await request.json()
+        customer_id = body.get("customerId")
+        if not customer_id:
+            return JSONResponse({"success": False, "message": "customerId is required", "data": None},
+                                status_code=400)
+        if kind == "orders":
+            rows = filter_history(dataset.orders(customer_id), "orderDate", body)
+        else:
+            rows = filter_history(dataset.invoices(customer_id), "invoiceDate", body)
+        return JSONResponse({
+            "success": True,
+            "message": f"{kind.capitalize()[:-1]} history retrieved successfully",
+            "data": rows,
+            "count": len(rows),
+        })
+
+    async def order_history(request: Request) -> JSONResponse:
+        return await history(request, "orders")
+
+    async def invoice_history(request: Request) -> JSONResponse:
+        return await history(request, "invoices")
+
+    return Starlette(routes=[
+        Route("/api/customers", search_customers, methods=["GET"]),
+        Route("/api/customers/{customer_id}", get_customer, methods=["GET"]),
+        Route("/api/finance/orders/history", order_history, methods=["POST"]),
+        Route("/api/finance/invoices/history", invoice_history, methods=["POST"]),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Fantaco Customer and Finance API for benchmarking")
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8090, help="Port to listen on (default: 8090)")
+    parser.add_argument("--customers", type=int, default=1000, help="Number of customers (default: 1000)")
+    parser.add_argument("--orders-per-customer", type=int, default=50,
+                        help="Average orders (and invoices) per customer (default: 50)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean injected latency (default: 0)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0,
+                        help="Standard deviation of injected latency (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with HTTP 500 (default: 0)")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset seed (default: 42)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    dataset = SyntheticDataset(args.customers, args.orders_per_customer, args.seed)
+    logger.info("=" * 60)
+    logger.info("Fake Fantaco API Configuration:")
+    logger.info(f"  Customers: {len(dataset.customers)}")
+    logger.info(f"  Orders per customer (avg): {args.orders_per_customer}")
+    logger.info(f"  History rows (approx): {len(dataset.customers) * args.orders_per_customer * 2}")
+    logger.info(f"  Latency: {args.latency_ms}ms +/- {args.jitter_ms}ms")
+    logger.info(f"  Error rate: {args.error_rate}")
+    logger.info(f"  Listening on: http://{args.host}:{args.port}")
+    logger.info("=" * 60)
+
+    app = create_app(dataset, args.latency_ms, args.jitter_ms, args.error_rate)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
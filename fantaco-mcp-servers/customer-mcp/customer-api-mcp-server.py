@@ -14,16 +14,41 @@ Environment Variables:
     CUSTOMER_API_BASE_URL: Base URL for the Customer API
     PORT_FOR_CUSTOMER_MCP: Port number for the MCP server (default: 9001)
     HOST_FOR_CUSTOMER_MCP: Host address to bind to (default: 0.0.0.0) 
+    CUSTOMER_HTTP_MAX_CONNECTIONS: Upstream connection pool size (default: 100)
+    CUSTOMER_HTTP_MAX_KEEPALIVE: Idle keep-alive connections retained in the pool (default: 20)
+    CUSTOMER_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open (default: 15)
+    CUSTOMER_HTTP2: Enable HTTP/2 to the Customer API, requires the h2 package (default: false)
+    CUSTOMER_HTTP_CONNECT_TIMEOUT: Seconds to establish a connection (default: 5)
+    CUSTOMER_HTTP_READ_TIMEOUT: Seconds to wait for response data (default: 30)
+    CUSTOMER_HTTP_WRITE_TIMEOUT: Seconds to wait while sending a request (default: 30)
+    CUSTOMER_HTTP_POOL_TIMEOUT: Seconds to wait for a free pooled connection (default: 10)
+    CUSTOMER_CACHE_TTL_SECONDS: Lifetime of cached lookups, 0 disables caching (default: 30)
+    CUSTOMER_CACHE_MAX_ENTRIES: Maximum number of cached lookups, LRU evicted (default: 1000)
+    CUSTOMER_BATCH_CONCURRENCY: Maximum concurrent upstream requests per get_customers call (default: 10)
+    CUSTOMER_BATCH_MAX_IDS: Maximum number of IDs accepted by get_customers (default: 100)
+    CUSTOMER_DEFAULT_FIELDS: Comma-separated customer fields returned when a tool call
+                             does not pass fields, "*" for all fields
+    CUSTOMER_LIST_FORMAT: Default encoding of list results: records, columns or csv (default: records)
                           
 """
 
 from fastmcp import FastMCP
 from dotenv import load_dotenv
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 import asyncio
+import contextvars
+import csv
+import functools
 import httpx
+import io
+import json
 import os
+import time
 import logging
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Literal, Awaitable, Callable, Hashable, List, Tuple
 
 # Initialize FastMCP server
 mcp = FastMCP("customer-api")
@@ -36,19 +61,203 @@ port = int(os.getenv("PORT_FOR_CUSTOMER_MCP", "9001"))
 host = os.getenv("HOST_FOR_CUSTOMER_MCP", "0.0.0.0")
 BASE_URL = os.getenv("CUSTOMER_API_BASE_URL")
 
+# Read-through cache for customer lookups (configurable via environment variables)
+CACHE_TTL_SECONDS = float(os.getenv("CUSTOMER_CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CUSTOMER_CACHE_MAX_ENTRIES", "1000"))
+
+# Batch lookup limits for get_customers
+BATCH_CONCURRENCY = int(os.getenv("CUSTOMER_BATCH_CONCURRENCY", "10"))
+BATCH_MAX_IDS = int(os.getenv("CUSTOMER_BATCH_MAX_IDS", "100"))
+
+# Customer fields returned by default, trimming rarely used ones such as fax and timestamps
+DEFAULT_FIELDS = os.getenv(
+    "CUSTOMER_DEFAULT_FIELDS",
+    "customerId,companyName,contactName,contactTitle,contactEmail,phone,city,country"
+)
+
+# Default encoding of list results; "columns" and "csv" avoid repeating keys in every row
+LIST_FORMAT = os.getenv("CUSTOMER_LIST_FORMAT", "records")
+
+# Upstream connection pool and timeouts (configurable via environment variables)
+HTTP_MAX_CONNECTIONS = int(os.getenv("CUSTOMER_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("CUSTOMER_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("CUSTOMER_HTTP_KEEPALIVE_EXPIRY", "15"))
+HTTP2 = os.getenv("CUSTOMER_HTTP2", "false").lower() in ("1", "true", "yes")
+HTTP_CONNECT_TIMEOUT = float(os.getenv("CUSTOMER_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("CUSTOMER_HTTP_READ_TIMEOUT", "30"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("CUSTOMER_HTTP_WRITE_TIMEOUT", "30"))
+HTTP_POOL_TIMEOUT = float(os.getenv("CUSTOMER_HTTP_POOL_TIMEOUT", "10"))
+
+# Prometheus metrics, exposed on GET /metrics
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOOL_CALLS = Counter("mcp_tool_calls_total", "MCP tool invocations", ["tool"])
+TOOL_ERRORS = Counter(
+    "mcp_tool_errors_total", "MCP tool calls that returned an error, by upstream HTTP status", ["tool", "status"])
+TOOL_LATENCY = Histogram(
+    "mcp_tool_duration_seconds", "End-to-end MCP tool latency", ["tool"], buckets=LATENCY_BUCKETS)
+UPSTREAM_LATENCY = Histogram(
+    "mcp_upstream_request_duration_seconds", "Latency of upstream API requests, by calling tool", ["tool"],
+    buckets=LATENCY_BUCKETS)
+RESPONSE_BYTES = Histogram(
+    "mcp_tool_response_bytes", "JSON size of MCP tool results", ["tool"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304))
+TOOLS_IN_FLIGHT = Gauge("mcp_tool_in_flight", "MCP tool calls currently executing", ["tool"])
+COMPACT_BYTES_SAVED = Counter(
+    "mcp_compact_bytes_saved_total", "JSON bytes saved by columns/csv list encoding", ["tool"])
+POOL_STATS = Gauge("mcp_upstream_pool", "Upstream connection pool usage, see /pool-stats", ["stat"])
+CACHE_STATS = Gauge("mcp_customer_cache", "Customer lookup cache hits, misses, coalesced misses and size", ["stat"])
+
+# Name of the tool being executed, used to label upstream request metrics
+current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="none")
 
 # HTTP client for API calls
 http_client: Optional[httpx.AsyncClient] = None
+http_transport: Optional["PoolStatsTransport"] = None
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response stream that reports when the response body has been released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class PoolStatsTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that tracks in-flight upstream requests for pool sizing."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.pool_timeouts = 0
+
+    def _release(self, started: float, tool: str):
+        self.in_flight -= 1
+        UPSTREAM_LATENCY.labels(tool).observe(time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        release = functools.partial(self._release, time.perf_counter(), current_tool.get())
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await super().handle_async_request(request)
+        except httpx.PoolTimeout:
+            self.pool_timeouts += 1
+            release()
+            raise
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 async def get_http_client() -> httpx.AsyncClient:
     """Get or create HTTP client."""
-    global http_client
+    global http_client, http_transport
     if http_client is None:
-        http_client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+        http2 = HTTP2 and _http2_available()
+        if HTTP2 and not http2:
+            logging.getLogger(__name__).warning(
+                "CUSTOMER_HTTP2 is enabled but the h2 package is not installed, using HTTP/1.1")
+        http_transport = PoolStatsTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        http_client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            transport=http_transport,
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+                write=HTTP_WRITE_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT,
+            ),
+        )
     return http_client
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Snapshot of upstream connection pool usage."""
+    stats = {
+        "max_connections": HTTP_MAX_CONNECTIONS,
+        "max_keepalive_connections": HTTP_MAX_KEEPALIVE,
+        "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+        "http2": HTTP2,
+        "in_flight": 0,
+        "peak_in_flight": 0,
+        "pool_timeouts": 0,
+        "connections": 0,
+        "active_connections": 0,
+        "idle_connections": 0,
+        "saturation": 0.0,
+    }
+    if http_transport is None:
+        return stats
+
+    stats["in_flight"] = http_transport.in_flight
+    stats["peak_in_flight"] = http_transport.peak_in_flight
+    stats["pool_timeouts"] = http_transport.pool_timeouts
+    # httpx does not expose its httpcore pool publicly; degrade to request counts only
+    pool = getattr(http_transport, "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    stats["connections"] = len(connections)
+    stats["idle_connections"] = idle
+    stats["active_connections"] = len(connections) - idle
+    stats["saturation"] = round(min(http_transport.in_flight / max(HTTP_MAX_CONNECTIONS, 1), 1.0), 3)
+    return stats
+
+
+@mcp.custom_route("/pool-stats", methods=["GET"])
+async def pool_stats(request: Request) -> JSONResponse:
+    """Report upstream connection pool saturation for capacity planning."""
+    return JSONResponse(get_pool_stats())
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus scrape endpoint."""
+    for stat, value in get_pool_stats().items():
+        if isinstance(value, (int, float)):
+            POOL_STATS.labels(stat).set(value)
+    CACHE_STATS.labels("hits").set(customer_cache.hits)
+    CACHE_STATS.labels("misses").set(customer_cache.misses)
+    CACHE_STATS.labels("coalesced").set(customer_cache.coalesced)
+    CACHE_STATS.labels("entries").set(len(customer_cache))
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 async def handle_response(response: httpx.Response) -> Dict[str, Any]:
     """Handle HTTP response and return JSON or error message"""
     try:
@@ -75,12 +284,184 @@ async def handle_response(response: httpx.Response) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def instrumented(fn: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Record call count, latency, in-flight count, result size and errors for a tool.
+
+    Apply below @mcp.tool() so FastMCP still sees the original signature.
+    """
+    tool = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        TOOL_CALLS.labels(tool).inc()
+        token = current_tool.set(tool)
+        start = time.perf_counter()
+        try:
+            with TOOLS_IN_FLIGHT.labels(tool).track_inprogress():
+                result = await fn(*args, **kwargs)
+        except Exception:
+            TOOL_ERRORS.labels(tool, "exception").inc()
+            raise
+        finally:
+            TOOL_LATENCY.labels(tool).observe(time.perf_counter() - start)
+            current_tool.reset(token)
+
+        if "error" in result:
+            TOOL_ERRORS.labels(tool, str(result.get("status_code", "none"))).inc()
+        RESPONSE_BYTES.labels(tool).observe(len(json.dumps(result, default=str)))
+        return result
+
+    return wrapper
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated field list; empty or "*" means all fields."""
+    fields = [field.strip() for field in (value or "").split(",") if field.strip()]
+    if not fields or "*" in fields:
+        return None
+    return fields
+
+
+def project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Return a copy of record with only the requested fields; None or ["*"] keeps them all."""
+    if not fields or "*" in fields:
+        return record
+    return {key: record[key] for key in fields if key in record}
+
+
+def encode_rows(rows: List[Any], list_format: Optional[str] = None) -> Any:
+    """
+    Encode a list of records without repeating keys in every row.
+
+    "columns" returns {"columns": [...], "rows": [[...], ...]} and "csv" returns a CSV
+    text block with a header line. Lists whose rows do not share the same keys are
+    returned unchanged, as are all lists in "records" format.
+    """
+    list_format = list_format or LIST_FORMAT
+    if list_format not in ("columns", "csv") or not rows or not all(isinstance(row, dict) for row in rows):
+        return rows
+    columns = list(rows[0])
+    if any(row.keys() != rows[0].keys() for row in rows):
+        return rows
+
+    values = [[row[column] for column in columns] for row in rows]
+    if list_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(values)
+        encoded = buffer.getvalue()
+    else:
+        encoded = {"columns": columns, "rows": values}
+
+    saved = len(json.dumps(rows, default=str)) - len(json.dumps(encoded, default=str))
+    COMPACT_BYTES_SAVED.labels(current_tool.get()).inc(max(saved, 0))
+    logging.getLogger(__name__).debug(
+        "Encoded %d rows as %s, saved %d JSON bytes", len(rows), list_format, saved)
+    return encoded
+
+
+class TTLCache:
+    """
+    Async read-through cache with TTL expiry and LRU eviction.
+
+    Concurrent misses for the same key are coalesced: the first caller starts
+    the upstream request and every other caller awaits the same task, so a
+    burst of lookups for a popular customer results in one API call.
+    Error responses are returned to all waiters but never stored.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Return the cached value for key, calling loader at most once per miss."""
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        # Shield so a cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        try:
+            value = await loader()
+            if "error" not in value:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+customer_cache = TTLCache(ttl_seconds=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES)
+default_fields = parse_fields(DEFAULT_FIELDS)
+
+
+async def fetch_customer(customer_id: str) -> Dict[str, Any]:
+    """Fetch a single customer through the cache."""
+    customer_id = customer_id.strip()
+
+    async def load() -> Dict[str, Any]:
+        client = await get_http_client()
+        response = await client.get(f"/api/customers/{customer_id}")
+        return await handle_response(response)
+
+    return await customer_cache.get_or_load(("customer", customer_id), load)
+
+
 @mcp.tool()
+@instrumented
 async def search_customers(
     company_name: Optional[str] = None,
     contact_name: Optional[str] = None,
     contact_email: Optional[str] = None,
-    phone: Optional[str] = None
+    phone: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    list_format: Optional[Literal["records", "columns", "csv"]] = None
 ) -> Dict[str, Any]:
     """
     Search for customers by various fields with partial matching
@@ -90,28 +471,44 @@ async def search_customers(
         contact_name: Filter by contact person name (partial matching, optional)
         contact_email: Filter by contact email address (partial matching, optional)
         phone: Filter by phone number (partial matching, optional)
+        fields: Customer fields to return (optional, default: customerId, companyName,
+                contactName, contactTitle, contactEmail, phone, city, country). Use ["*"] for all fields
+        list_format: Encoding of the returned list (optional, default set by the server):
+                     "records" (list of objects), "columns" ({"columns": [...], "rows": [[...], ...]})
+                     or "csv" (CSV text with a header line)
 
     Returns:
         List of customers matching the search criteria
     """
     params = {}
 
-    if company_name:
-        params["companyName"] = company_name
-    if contact_name:
-        params["contactName"] = contact_name
-    if contact_email:
-        params["contactEmail"] = contact_email
-    if phone:
-        params["phone"] = phone
+    # Normalize so equivalent searches share a cache entry; the Customer API
+    # matches names and emails case-insensitively
+    if company_name and company_name.strip():
+        params["companyName"] = company_name.strip().lower()
+    if contact_name and contact_name.strip():
+        params["contactName"] = contact_name.strip().lower()
+    if contact_email and contact_email.strip():
+        params["contactEmail"] = contact_email.strip().lower()
+    if phone and phone.strip():
+        params["phone"] = phone.strip()
+
+    async def load() -> Dict[str, Any]:
+        client = await get_http_client()
+        response = await client.get("/api/customers", params=params)
+        return await handle_response(response)
 
-    client = await get_http_client()
-    response = await client.get("/api/customers", params=params)
-    return await handle_response(response)
+    result = await customer_cache.get_or_load(("search", tuple(sorted(params.items()))), load)
+    if isinstance(result.get("results"), list):
+        fields = fields or default_fields
+        customers = [project(customer, fields) for customer in result["results"]]
+        return {**result, "results": encode_rows(customers, list_format)}
+    return result
 
 
 @mcp.tool()
-async def get_customer(customer_id: str) -> Dict[str, Any]:
+@instrumented
+async def get_customer(customer_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Get customer by ID
 
@@ -119,23 +516,75 @@ async def get_customer(customer_id: str) -> Dict[str, Any]:
 
     Args:
         customer_id: The unique 5-character identifier of the customer
+        fields: Customer fields to return (optional, default: customerId, companyName,
+                contactName, contactTitle, contactEmail, phone, city, country). Use ["*"] for all
+                fields: customerId, companyName, contactName, contactTitle, address, city, region,
+                postalCode, country, phone, fax, contactEmail, createdAt, and updatedAt
 
     Returns:
-        Customer details including customerId, companyName, contactName, contactTitle,
-        address, city, region, postalCode, country, phone, fax, contactEmail,
-        createdAt, and updatedAt
+        Customer details, limited to the requested fields
     """
-    client = await get_http_client()
-    response = await client.get(f"/api/customers/{customer_id}")
-    return await handle_response(response)
+    result = await fetch_customer(customer_id)
+    if "error" in result:
+        return result
+    return project(result, fields or default_fields)
+
+
+@mcp.tool()
+@instrumented
+async def get_customers(customer_ids: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Get multiple customers by ID in one call
+
+    Retrieves several customer records concurrently. Use this instead of calling
+    get_customer repeatedly when more than one customer is needed.
+
+    Args:
+        customer_ids: List of unique 5-character customer identifiers
+        fields: Customer fields to return (optional, same default as get_customer). Use ["*"] for all fields
+
+    Returns:
+        Dictionary containing:
+        - results: One entry per requested ID, in the same order as customer_ids.
+          Each entry is the customer record, or an object with customerId, error
+          and status_code when that customer could not be retrieved
+        - count: Number of customers retrieved successfully
+        - errors: Number of IDs that failed
+    """
+    if len(customer_ids) > BATCH_MAX_IDS:
+        return {
+            "error": f"Too many customer IDs: {len(customer_ids)} (maximum {BATCH_MAX_IDS})",
+            "status_code": 400
+        }
+
+    semaphore = asyncio.Semaphore(max(BATCH_CONCURRENCY, 1))
+
+    async def fetch_one(customer_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await fetch_customer(customer_id)
+            except Exception as e:
+                result = {"error": str(e)}
+        if "error" in result:
+            return {"customerId": customer_id, **result}
+        return project(result, fields or default_fields)
+
+    results = await asyncio.gather(*(fetch_one(customer_id) for customer_id in customer_ids))
+    errors = sum(1 for result in results if "error" in result)
+    return {
+        "results": results,
+        "count": len(results) - errors,
+        "errors": errors
+    }
 
 
 async def cleanup():
     """Cleanup resources."""
-    global http_client
+    global http_client, http_transport
     if http_client:
         await http_client.aclose()
         http_client = None
+        http_transport = None
 
 
 if __name__ == "__main__":
@@ -153,6 +602,18 @@ if __name__ == "__main__":
     logger.info(f"  CUSTOMER_API_BASE_URL: {BASE_URL}")
     logger.info(f"  PORT_FOR_CUSTOMER_MCP: {port}")
     logger.info(f"  HOST_FOR_CUSTOMER_MCP: {host}")
+    logger.info(f"  CUSTOMER_HTTP_MAX_CONNECTIONS: {HTTP_MAX_CONNECTIONS}")
+    logger.info(f"  CUSTOMER_HTTP_MAX_KEEPALIVE: {HTTP_MAX_KEEPALIVE}")
+    logger.info(f"  CUSTOMER_HTTP_KEEPALIVE_EXPIRY: {HTTP_KEEPALIVE_EXPIRY}")
+    logger.info(f"  CUSTOMER_HTTP2: {HTTP2}")
+    logger.info(f"  CUSTOMER_HTTP timeouts (connect/read/write/pool): "
+                f"{HTTP_CONNECT_TIMEOUT}/{HTTP_READ_TIMEOUT}/{HTTP_WRITE_TIMEOUT}/{HTTP_POOL_TIMEOUT}")
+    logger.info(f"  CUSTOMER_CACHE_TTL_SECONDS: {CACHE_TTL_SECONDS}")
+    logger.info(f"  CUSTOMER_CACHE_MAX_ENTRIES: {CACHE_MAX_ENTRIES}")
+    logger.info(f"  CUSTOMER_BATCH_CONCURRENCY: {BATCH_CONCURRENCY}")
+    logger.info(f"  CUSTOMER_BATCH_MAX_IDS: {BATCH_MAX_IDS}")
+    logger.info(f"  CUSTOMER_DEFAULT_FIELDS: {DEFAULT_FIELDS}")
+    logger.info(f"  CUSTOMER_LIST_FORMAT: {LIST_FORMAT}")
     logger.info("=" * 60)
 
     try:
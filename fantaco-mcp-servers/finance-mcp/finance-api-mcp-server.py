@@ -14,15 +14,41 @@ Environment Variables:
     FINANCE_API_BASE_URL: Base URL for the Finance API
     PORT_FOR_FINANCE_MCP: Port number for the MCP server (default: 9002)
     HOST_FOR_FINANCE_MCP: Host address to bind to (default: 0.0.0.0)
+    FINANCE_HTTP_MAX_CONNECTIONS: Upstream connection pool size (default: 100)
+    FINANCE_HTTP_MAX_KEEPALIVE: Idle keep-alive connections retained in the pool (default: 20)
+    FINANCE_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open (default: 15)
+    FINANCE_HTTP2: Enable HTTP/2 to the Finance API, requires the h2 package (default: false)
+    FINANCE_HTTP_CONNECT_TIMEOUT: Seconds to establish a connection (default: 5)
+    FINANCE_HTTP_READ_TIMEOUT: Seconds to wait for response data (default: 30)
+    FINANCE_HTTP_WRITE_TIMEOUT: Seconds to wait while sending a request (default: 30)
+    FINANCE_HTTP_POOL_TIMEOUT: Seconds to wait for a free pooled connection (default: 10)
+    FINANCE_SUMMARY_MAX_ROWS: Maximum rows read from the Finance API to build a summary (default: 10000)
+    FINANCE_ORDER_DEFAULT_FIELDS: Comma-separated order fields returned when a tool call
+                                  does not pass fields, "*" for all fields
+    FINANCE_INVOICE_DEFAULT_FIELDS: Comma-separated invoice fields returned when a tool call
+                                    does not pass fields, "*" for all fields
+    FINANCE_LIST_FORMAT: Default encoding of list results: records, columns or csv (default: records)
 """
 
 from fastmcp import FastMCP
 from dotenv import load_dotenv
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 import asyncio
+import base64
+import binascii
+import contextvars
+import csv
+import functools
 import httpx
+import io
+import json
 import os
+import time
+from datetime import datetime
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal, Awaitable, Callable, List
 
 # Initialize FastMCP server
 mcp = FastMCP("finance-api")
@@ -35,18 +61,197 @@ port = int(os.getenv("PORT_FOR_FINANCE_MCP", "9002"))
 host = os.getenv("HOST_FOR_FINANCE_MCP", "0.0.0.0")
 BASE_URL = os.getenv("FINANCE_API_BASE_URL")
 
+# Default encoding of list results; "columns" and "csv" avoid repeating keys in every row
+LIST_FORMAT = os.getenv("FINANCE_LIST_FORMAT", "records")
+
+# Upstream connection pool and timeouts (configurable via environment variables)
+HTTP_MAX_CONNECTIONS = int(os.getenv("FINANCE_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("FINANCE_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("FINANCE_HTTP_KEEPALIVE_EXPIRY", "15"))
+HTTP2 = os.getenv("FINANCE_HTTP2", "false").lower() in ("1", "true", "yes")
+HTTP_CONNECT_TIMEOUT = float(os.getenv("FINANCE_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("FINANCE_HTTP_READ_TIMEOUT", "30"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("FINANCE_HTTP_WRITE_TIMEOUT", "30"))
+HTTP_POOL_TIMEOUT = float(os.getenv("FINANCE_HTTP_POOL_TIMEOUT", "10"))
+
+# Upper bound on history rows pulled from the Finance API for summaries
+SUMMARY_MAX_ROWS = int(os.getenv("FINANCE_SUMMARY_MAX_ROWS", "10000"))
+
+# Order and invoice fields returned by default, trimming audit timestamps
+ORDER_DEFAULT_FIELDS = os.getenv(
+    "FINANCE_ORDER_DEFAULT_FIELDS",
+    "id,orderNumber,customerId,totalAmount,status,orderDate"
+)
+INVOICE_DEFAULT_FIELDS = os.getenv(
+    "FINANCE_INVOICE_DEFAULT_FIELDS",
+    "id,invoiceNumber,orderId,customerId,amount,status,invoiceDate,dueDate,paidDate"
+)
+
+# Prometheus metrics, exposed on GET /metrics
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOOL_CALLS = Counter("mcp_tool_calls_total", "MCP tool invocations", ["tool"])
+TOOL_ERRORS = Counter(
+    "mcp_tool_errors_total", "MCP tool calls that returned an error, by upstream HTTP status", ["tool", "status"])
+TOOL_LATENCY = Histogram(
+    "mcp_tool_duration_seconds", "End-to-end MCP tool latency", ["tool"], buckets=LATENCY_BUCKETS)
+UPSTREAM_LATENCY = Histogram(
+    "mcp_upstream_request_duration_seconds", "Latency of upstream API requests, by calling tool", ["tool"],
+    buckets=LATENCY_BUCKETS)
+RESPONSE_BYTES = Histogram(
+    "mcp_tool_response_bytes", "JSON size of MCP tool results", ["tool"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304))
+TOOLS_IN_FLIGHT = Gauge("mcp_tool_in_flight", "MCP tool calls currently executing", ["tool"])
+COMPACT_BYTES_SAVED = Counter(
+    "mcp_compact_bytes_saved_total", "JSON bytes saved by columns/csv list encoding", ["tool"])
+POOL_STATS = Gauge("mcp_upstream_pool", "Upstream connection pool usage, see /pool-stats", ["stat"])
+
+# Name of the tool being executed, used to label upstream request metrics
+current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="none")
+
 # HTTP client for API calls
 http_client: Optional[httpx.AsyncClient] = None
+http_transport: Optional["PoolStatsTransport"] = None
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response stream that reports when the response body has been released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class PoolStatsTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that tracks in-flight upstream requests for pool sizing."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.pool_timeouts = 0
+
+    def _release(self, started: float, tool: str):
+        self.in_flight -= 1
+        UPSTREAM_LATENCY.labels(tool).observe(time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        release = functools.partial(self._release, time.perf_counter(), current_tool.get())
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await super().handle_async_request(request)
+        except httpx.PoolTimeout:
+            self.pool_timeouts += 1
+            release()
+            raise
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 async def get_http_client() -> httpx.AsyncClient:
     """Get or create HTTP client."""
-    global http_client
+    global http_client, http_transport
     if http_client is None:
-        http_client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+        http2 = HTTP2 and _http2_available()
+        if HTTP2 and not http2:
+            logging.getLogger(__name__).warning(
+                "FINANCE_HTTP2 is enabled but the h2 package is not installed, using HTTP/1.1")
+        http_transport = PoolStatsTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        http_client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            transport=http_transport,
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+                write=HTTP_WRITE_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT,
+            ),
+        )
     return http_client
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Snapshot of upstream connection pool usage."""
+    stats = {
+        "max_connections": HTTP_MAX_CONNECTIONS,
+        "max_keepalive_connections": HTTP_MAX_KEEPALIVE,
+        "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+        "http2": HTTP2,
+        "in_flight": 0,
+        "peak_in_flight": 0,
+        "pool_timeouts": 0,
+        "connections": 0,
+        "active_connections": 0,
+        "idle_connections": 0,
+        "saturation": 0.0,
+    }
+    if http_transport is None:
+        return stats
+
+    stats["in_flight"] = http_transport.in_flight
+    stats["peak_in_flight"] = http_transport.peak_in_flight
+    stats["pool_timeouts"] = http_transport.pool_timeouts
+    # httpx does not expose its httpcore pool publicly; degrade to request counts only
+    pool = getattr(http_transport, "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    stats["connections"] = len(connections)
+    stats["idle_connections"] = idle
+    stats["active_connections"] = len(connections) - idle
+    stats["saturation"] = round(min(http_transport.in_flight / max(HTTP_MAX_CONNECTIONS, 1), 1.0), 3)
+    return stats
+
+
+@mcp.custom_route("/pool-stats", methods=["GET"])
+async def pool_stats(request: Request) -> JSONResponse:
+    """Report upstream connection pool saturation for capacity planning."""
+    return JSONResponse(get_pool_stats())
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus scrape endpoint."""
+    for stat, value in get_pool_stats().items():
+        if isinstance(value, (int, float)):
+            POOL_STATS.labels(stat).set(value)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 async def handle_response(response: httpx.Response) -> Dict[str, Any]:
     """Handle HTTP response and return JSON or error message"""
     try:
@@ -73,24 +278,245 @@ async def handle_response(response: httpx.Response) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def instrumented(fn: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Record call count, latency, in-flight count, result size and errors for a tool.
+
+    Apply below @mcp.tool() so FastMCP still sees the original signature.
+    """
+    tool = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        TOOL_CALLS.labels(tool).inc()
+        token = current_tool.set(tool)
+        start = time.perf_counter()
+        try:
+            with TOOLS_IN_FLIGHT.labels(tool).track_inprogress():
+                result = await fn(*args, **kwargs)
+        except Exception:
+            TOOL_ERRORS.labels(tool, "exception").inc()
+            raise
+        finally:
+            TOOL_LATENCY.labels(tool).observe(time.perf_counter() - start)
+            current_tool.reset(token)
+
+        if "error" in result:
+            TOOL_ERRORS.labels(tool, str(result.get("status_code", "none"))).inc()
+        RESPONSE_BYTES.labels(tool).observe(len(json.dumps(result, default=str)))
+        return result
+
+    return wrapper
+
+
+def parse_fields(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated field list; empty or "*" means all fields."""
+    fields = [field.strip() for field in (value or "").split(",") if field.strip()]
+    if not fields or "*" in fields:
+        return None
+    return fields
+
+
+def project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Return a copy of record with only the requested fields; None or ["*"] keeps them all."""
+    if not fields or "*" in fields:
+        return record
+    return {key: record[key] for key in fields if key in record}
+
+
+def encode_rows(rows: List[Any], list_format: Optional[str] = None) -> Any:
+    """
+    Encode a list of records without repeating keys in every row.
+
+    "columns" returns {"columns": [...], "rows": [[...], ...]} and "csv" returns a CSV
+    text block with a header line. Lists whose rows do not share the same keys are
+    returned unchanged, as are all lists in "records" format.
+    """
+    list_format = list_format or LIST_FORMAT
+    if list_format not in ("columns", "csv") or not rows or not all(isinstance(row, dict) for row in rows):
+        return rows
+    columns = list(rows[0])
+    if any(row.keys() != rows[0].keys() for row in rows):
+        return rows
+
+    values = [[row[column] for column in columns] for row in rows]
+    if list_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(values)
+        encoded = buffer.getvalue()
+    else:
+        encoded = {"columns": columns, "rows": values}
+
+    saved = len(json.dumps(rows, default=str)) - len(json.dumps(encoded, default=str))
+    COMPACT_BYTES_SAVED.labels(current_tool.get()).inc(max(saved, 0))
+    logging.getLogger(__name__).debug(
+        "Encoded %d rows as %s, saved %d JSON bytes", len(rows), list_format, saved)
+    return encoded
+
+
+order_default_fields = parse_fields(ORDER_DEFAULT_FIELDS)
+invoice_default_fields = parse_fields(INVOICE_DEFAULT_FIELDS)
+
+
+def encode_cursor(offset: int) -> str:
+    """Encode a result offset as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Decode a pagination cursor back into a result offset."""
+    if not cursor:
+        return 0
+    try:
+        offset = int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["offset"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return offset
+
+
+def to_amount(value: Any) -> float:
+    """Convert an API amount (number, numeric string or null) to a float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def summarize_orders(orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate order rows into counts and totals per status."""
+    by_status: Dict[str, Dict[str, Any]] = {}
+    total_amount = 0.0
+    order_dates = []
+    for order in orders:
+        amount = to_amount(order.get("totalAmount"))
+        total_amount += amount
+        bucket = by_status.setdefault(order.get("status") or "UNKNOWN", {"count": 0, "total_amount": 0.0})
+        bucket["count"] += 1
+        bucket["total_amount"] += amount
+        if order.get("orderDate"):
+            order_dates.append(order["orderDate"])
+
+    for bucket in by_status.values():
+        bucket["total_amount"] = round(bucket["total_amount"], 2)
+    return {
+        "order_count": len(orders),
+        "truncated": False,
+        "total_amount": round(total_amount, 2),
+        "by_status": by_status,
+        "first_order_date": min(order_dates) if order_dates else None,
+        "last_order_date": max(order_dates) if order_dates else None
+    }
+
+
+# Invoice statuses that still expect a payment
+UNPAID_INVOICE_STATUSES = ("SENT", "OVERDUE")
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 API date into a naive local datetime, or None when empty or malformed."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def summarize_invoices(invoices: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate invoice rows into status, unpaid, overdue and monthly totals in one pass.
+
+    A plain loop rather than a vectorized one: the rows are capped at FINANCE_SUMMARY_MAX_ROWS
+    and the servers do not depend on numpy or pandas.
+    """
+    now = datetime.now()
+    by_status: Dict[str, Dict[str, Any]] = {}
+    by_month: Dict[str, Dict[str, Any]] = {}
+    total_amount = unpaid_amount = overdue_amount = 0.0
+    unpaid_count = overdue_count = 0
+    oldest_unpaid = oldest_unpaid_date = None
+
+    for invoice in invoices:
+        amount = to_amount(invoice.get("amount"))
+        status = invoice.get("status") or "UNKNOWN"
+        invoice_date = parse_date(invoice.get("invoiceDate"))
+        total_amount += amount
+
+        bucket = by_status.setdefault(status, {"count": 0, "total_amount": 0.0})
+        bucket["count"] += 1
+        bucket["total_amount"] += amount
+
+        month = by_month.setdefault(invoice_date.strftime("%Y-%m") if invoice_date else "UNKNOWN",
+                                    {"count": 0, "total_amount": 0.0})
+        month["count"] += 1
+        month["total_amount"] += amount
+
+        if status in UNPAID_INVOICE_STATUSES:
+            unpaid_count += 1
+            unpaid_amount += amount
+            due_date = parse_date(invoice.get("dueDate"))
+            if status == "OVERDUE" or (due_date and due_date < now):
+                overdue_count += 1
+                overdue_amount += amount
+            # Undated invoices cannot be ordered, so they never count as the oldest
+            if invoice_date and (oldest_unpaid_date is None or invoice_date < oldest_unpaid_date):
+                oldest_unpaid, oldest_unpaid_date = invoice, invoice_date
+
+    for bucket in list(by_status.values()) + list(by_month.values()):
+        bucket["total_amount"] = round(bucket["total_amount"], 2)
+    return {
+        "invoice_count": len(invoices),
+        "truncated": False,
+        "total_amount": round(total_amount, 2),
+        "by_status": by_status,
+        "unpaid_count": unpaid_count,
+        "unpaid_amount": round(unpaid_amount, 2),
+        "overdue_count": overdue_count,
+        "overdue_amount": round(overdue_amount, 2),
+        "oldest_unpaid_invoice": {
+            key: oldest_unpaid.get(key)
+            for key in ("id", "invoiceNumber", "orderId", "amount", "status", "invoiceDate", "dueDate")
+        } if oldest_unpaid else None,
+        "by_month": dict(sorted(by_month.items()))
+    }
+
+
 
 @mcp.tool()
+@instrumented
 async def fetch_order_history(
     customer_id: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = 50
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    summary_only: bool = False,
+    fields: Optional[List[str]] = None,
+    list_format: Optional[Literal["records", "columns", "csv"]] = None
 ) -> Dict[str, Any]:
     """
     Get order history for a customer.
 
     Retrieves the order history for a specific customer with optional date filtering and pagination.
+    Orders are returned newest first, one page at a time. Pass next_cursor from the previous
+    result as cursor to get the next page. Use summary_only when only counts and totals are needed.
 
     Args:
         customer_id: Unique identifier for the customer (e.g., "CUST-12345")
         start_date: Start date for filtering orders in ISO 8601 format (e.g., "2024-01-15T10:30:00")
         end_date: End date for filtering orders in ISO 8601 format (e.g., "2024-01-31T23:59:59")
-        limit: Maximum number of orders to return (default: 50)
+        limit: Maximum number of orders to return per page (default: 50)
+        cursor: Opaque cursor from a previous call's next_cursor (optional)
+        summary_only: Return aggregates over all matching orders instead of order rows (default: False)
+        fields: Order fields to return (optional, default: id, orderNumber, customerId, totalAmount,
+                status, orderDate). Use ["*"] for all fields, including createdAt and updatedAt
+        list_format: Encoding of the returned list (optional, default set by the server):
+                     "records" (list of objects), "columns" ({"columns": [...], "rows": [[...], ...]})
+                     or "csv" (CSV text with a header line)
 
     Returns:
         Dictionary containing:
@@ -98,13 +524,26 @@ async def fetch_order_history(
         - message: Description of the result
         - data: List of order objects with details (id, orderNumber, customerId, totalAmount, status, orderDate, etc.)
         - count: Number of orders returned
+        - next_cursor: Cursor for the next page, or null when there are no more orders
+        When summary_only is set, data and next_cursor are replaced by summary, containing
+        order_count, truncated, total_amount, by_status (count and total_amount per status),
+        first_order_date and last_order_date. truncated is true when the customer has more than
+        FINANCE_SUMMARY_MAX_ROWS matching orders; the summary then covers only the first
+        order_count of them
     """
+    try:
+        offset = decode_cursor(cursor)
+    except ValueError as e:
+        return {"error": str(e), "status_code": 400}
+    limit = max(limit, 1)
+
     client = await get_http_client()
 
-    # Build request payload
+    # Build request payload. The Finance API has no offset, so read one row past
+    # the requested page to know whether another page exists
     payload = {
         "customerId": customer_id,
-        "limit": limit
+        "limit": SUMMARY_MAX_ROWS + 1 if summary_only else offset + limit + 1
     }
 
     if start_date:
@@ -115,15 +554,36 @@ async def fetch_order_history(
     # Make POST request
     response = await client.post("/api/finance/orders/history", json=payload)
 
-    return await handle_response(response)
+    result = await handle_response(response)
+    orders = result.get("data")
+    if "error" in result or not isinstance(orders, list):
+        return result
+
+    if summary_only:
+        result.pop("data")
+        result["summary"] = summarize_orders(orders[:SUMMARY_MAX_ROWS])
+        # The extra row read past the cap means the summary does not cover every order
+        result["summary"]["truncated"] = len(orders) > SUMMARY_MAX_ROWS
+        result["count"] = result["summary"]["order_count"]
+        return result
+
+    fields = fields or order_default_fields
+    page = [project(order, fields) for order in orders[offset:offset + limit]]
+    result["data"] = encode_rows(page, list_format)
+    result["count"] = len(page)
+    result["next_cursor"] = encode_cursor(offset + limit) if len(orders) > offset + limit else None
+    return result
 
 
 @mcp.tool()
+@instrumented
 async def fetch_invoice_history(
     customer_id: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = 50
+    limit: int = 50,
+    fields: Optional[List[str]] = None,
+    list_format: Optional[Literal["records", "columns", "csv"]] = None
 ) -> Dict[str, Any]:
     """
     Get invoice history for a customer.
@@ -135,6 +595,12 @@ async def fetch_invoice_history(
         start_date: Start date for filtering invoices in ISO 8601 format (e.g., "2024-01-15T10:30:00")
         end_date: End date for filtering invoices in ISO 8601 format (e.g., "2024-01-31T23:59:59")
         limit: Maximum number of invoices to return (default: 50)
+        fields: Invoice fields to return (optional, default: id, invoiceNumber, orderId, customerId,
+                amount, status, invoiceDate, dueDate, paidDate). Use ["*"] for all fields,
+                including createdAt and updatedAt
+        list_format: Encoding of the returned list (optional, default set by the server):
+                     "records" (list of objects), "columns" ({"columns": [...], "rows": [[...], ...]})
+                     or "csv" (CSV text with a header line)
 
     Returns:
         Dictionary containing:
@@ -159,15 +625,78 @@ async def fetch_invoice_history(
     # Make POST request
     response = await client.post("/api/finance/invoices/history", json=payload)
 
-    return await handle_response(response)
+    result = await handle_response(response)
+    if isinstance(result.get("data"), list):
+        fields = fields or invoice_default_fields
+        invoices = [project(invoice, fields) for invoice in result["data"]]
+        result["data"] = encode_rows(invoices, list_format)
+    return result
+
+
+@mcp.tool()
+@instrumented
+async def summarize_invoice_history(
+    customer_id: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get invoice totals for a customer.
+
+    Computes aggregates over the customer's invoice history on the server, so questions
+    about totals, unpaid or overdue amounts do not need every invoice row.
+    Use fetch_invoice_history when individual invoices are needed.
+
+    Args:
+        customer_id: Unique identifier for the customer (e.g., "CUST-12345")
+        start_date: Start date for filtering invoices in ISO 8601 format (e.g., "2024-01-15T10:30:00")
+        end_date: End date for filtering invoices in ISO 8601 format (e.g., "2024-01-31T23:59:59")
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating if the request was successful
+        - message: Description of the result
+        - summary: invoice_count, truncated, total_amount, by_status (count and total_amount per status),
+          unpaid_count, unpaid_amount, overdue_count, overdue_amount,
+          oldest_unpaid_invoice and by_month (count and total_amount per YYYY-MM).
+          truncated is true when the customer has more than FINANCE_SUMMARY_MAX_ROWS matching
+          invoices; the summary then covers only the first invoice_count of them
+    """
+    client = await get_http_client()
+
+    # Build request payload
+    payload = {
+        "customerId": customer_id,
+        "limit": SUMMARY_MAX_ROWS + 1
+    }
+
+    if start_date:
+        payload["startDate"] = start_date
+    if end_date:
+        payload["endDate"] = end_date
+
+    # Make POST request
+    response = await client.post("/api/finance/invoices/history", json=payload)
+
+    result = await handle_response(response)
+    invoices = result.pop("data", None)
+    if "error" in result or not isinstance(invoices, list):
+        return result
+
+    result["summary"] = summarize_invoices(invoices[:SUMMARY_MAX_ROWS])
+    # The extra row read past the cap means the summary does not cover every invoice
+    result["summary"]["truncated"] = len(invoices) > SUMMARY_MAX_ROWS
+    result["count"] = result["summary"]["invoice_count"]
+    return result
 
 
 async def cleanup():
     """Cleanup resources."""
-    global http_client
+    global http_client, http_transport
     if http_client:
         await http_client.aclose()
         http_client = None
+        http_transport = None
 
 
 if __name__ == "__main__":
@@ -184,6 +713,16 @@ if __name__ == "__main__":
     logger.info(f"  FINANCE_API_BASE_URL: {BASE_URL}")
     logger.info(f"  PORT_FOR_FINANCE_MCP: {port}")
     logger.info(f"  HOST_FOR_FINANCE_MCP: {host}")
+    logger.info(f"  FINANCE_HTTP_MAX_CONNECTIONS: {HTTP_MAX_CONNECTIONS}")
+    logger.info(f"  FINANCE_HTTP_MAX_KEEPALIVE: {HTTP_MAX_KEEPALIVE}")
+    logger.info(f"  FINANCE_HTTP_KEEPALIVE_EXPIRY: {HTTP_KEEPALIVE_EXPIRY}")
+    logger.info(f"  FINANCE_HTTP2: {HTTP2}")
+    logger.info(f"  FINANCE_SUMMARY_MAX_ROWS: {SUMMARY_MAX_ROWS}")
+    logger.info(f"  FINANCE_ORDER_DEFAULT_FIELDS: {ORDER_DEFAULT_FIELDS}")
+    logger.info(f"  FINANCE_INVOICE_DEFAULT_FIELDS: {INVOICE_DEFAULT_FIELDS}")
+    logger.info(f"  FINANCE_LIST_FORMAT: {LIST_FORMAT}")
+    logger.info(f"  FINANCE_HTTP timeouts (connect/read/write/pool): "
+                f"{HTTP_CONNECT_TIMEOUT}/{HTTP_READ_TIMEOUT}/{HTTP_WRITE_TIMEOUT}/{HTTP_POOL_TIMEOUT}")
     logger.info("=" * 60)
 
     try: